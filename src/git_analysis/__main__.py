@@ -2,5 +2,6 @@ from __future__ import annotations
 
 from .cli import main
 
-raise SystemExit(main())
-
+# Guarded so worker processes started with the "spawn" method can import this module without re-running the CLI.
+if __name__ == "__main__":
+    raise SystemExit(main())
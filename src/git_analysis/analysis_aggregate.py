@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import datetime as dt
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
 
 from .analysis_periods import Period
 from .identity import MeMatcher
@@ -25,16 +25,6 @@ def repo_period_stats(r: RepoResult, period_label: str, include_bootstraps: bool
     return out
 
 
-def merge_breakdown(dst: dict[str, dict[str, int]], src: dict[str, dict[str, int]]) -> None:
-    for key, st in src.items():
-        cur = dst.get(key)
-        if cur is None:
-            dst[key] = {k: int(v) for k, v in st.items()}
-            continue
-        for k, v in st.items():
-            cur[k] = int(cur.get(k, 0)) + int(v)
-
-
 def merge_me_monthly(dst: dict[str, dict[str, int]], src: dict[str, dict[str, int]]) -> None:
     for month, st in src.items():
         cur = dst.get(month)
@@ -306,53 +296,49 @@ def aggregate_authors(
     return agg
 
 
-def aggregate_period(
-    repos: list[RepoResult],
-    period: Period,
-    me: MeMatcher,
-    *,
-    include_bootstraps: bool,
-    bootstraps_only: bool = False,
-) -> dict:
-    total = RepoYearStats()
-    repos_with_commits = 0
-    repos_with_my_commits = 0
-    new_projects_by_history = 0
-    new_projects_started_by_me = 0
-
+def aggregate_authors_variants(
+    repos: list[RepoResult], period_label: str
+) -> tuple[dict[str, AuthorStats], dict[str, AuthorStats], dict[str, AuthorStats]]:
+    """Excluding-bootstraps, bootstraps-only and including-bootstraps author maps from one pass over `repos`."""
+    excl: dict[str, AuthorStats] = {}
+    boot: dict[str, AuthorStats] = {}
+    incl: dict[str, AuthorStats] = {}
     for r in repos:
-        if bootstraps_only:
-            ys = r.period_stats_bootstraps.get(period.label, RepoYearStats())
-        else:
-            ys = repo_period_stats(r, period.label, include_bootstraps=include_bootstraps)
-        if ys.commits_total > 0:
-            repos_with_commits += 1
-        if ys.commits_me > 0:
-            repos_with_my_commits += 1
+        repo_excl = r.authors_by_period_excl_bootstraps.get(period_label, {})
+        repo_boot = r.authors_by_period_bootstraps.get(period_label, {})
+        merge_author_stats(excl, repo_excl)
+        merge_author_stats(boot, repo_boot)
+        merge_author_stats(incl, repo_excl)
+        merge_author_stats(incl, repo_boot)
+    return excl, boot, incl
 
-        if r.first_commit_iso:
-            try:
-                first_date = dt.date.fromisoformat(r.first_commit_iso[:10])
-            except ValueError:
-                first_date = None
-            if first_date is not None and (period.start <= first_date < period.end):
-                new_projects_by_history += 1
-                if r.first_commit_author_name and r.first_commit_author_email:
-                    if me.matches(r.first_commit_author_name, r.first_commit_author_email):
-                        new_projects_started_by_me += 1
 
-        total.commits_total += ys.commits_total
-        total.commits_me += ys.commits_me
-        total.insertions_total += ys.insertions_total
-        total.deletions_total += ys.deletions_total
-        total.insertions_me += ys.insertions_me
-        total.deletions_me += ys.deletions_me
+def _is_new_project(r: RepoResult, period: Period) -> bool:
+    first_date = r.first_commit_date
+    return first_date is not None and (period.start <= first_date < period.end)
+
 
+def _started_by_me(r: RepoResult, me: MeMatcher) -> bool:
+    return bool(r.first_commit_author_name and r.first_commit_author_email) and me.matches(
+        r.first_commit_author_name, r.first_commit_author_email
+    )
+
+
+def _period_aggregate(
+    period: Period,
+    total: RepoYearStats,
+    *,
+    repos_total: int,
+    repos_with_commits: int,
+    repos_with_my_commits: int,
+    new_projects_by_history: int,
+    new_projects_started_by_me: int,
+) -> dict:
     out: dict[str, object] = {
         "period": period.label,
         "start": period.start_iso,
         "end": period.end_iso,
-        "repos_total": len(repos),
+        "repos_total": repos_total,
         "repos_with_commits": repos_with_commits,
         "repos_with_my_commits": repos_with_my_commits,
         "new_projects_by_history": new_projects_by_history,
@@ -375,32 +361,117 @@ def aggregate_period(
     return out
 
 
-def aggregate_languages(
+def aggregate_period(
     repos: list[RepoResult],
-    period_label: str,
+    period: Period,
+    me: MeMatcher,
     *,
     include_bootstraps: bool,
     bootstraps_only: bool = False,
-) -> dict[str, dict[str, int]]:
-    agg: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"insertions": 0, "deletions": 0, "insertions_me": 0, "deletions_me": 0}
-    )
+) -> dict:
+    total = RepoYearStats()
+    repos_with_commits = 0
+    repos_with_my_commits = 0
+    new_projects_by_history = 0
+    new_projects_started_by_me = 0
+
     for r in repos:
         if bootstraps_only:
-            merge_breakdown(agg, r.languages_by_period_bootstraps.get(period_label, {}))
+            ys = r.period_stats_bootstraps.get(period.label, RepoYearStats())
         else:
-            merge_breakdown(agg, r.languages_by_period_excl_bootstraps.get(period_label, {}))
-            if include_bootstraps:
-                merge_breakdown(agg, r.languages_by_period_bootstraps.get(period_label, {}))
+            ys = repo_period_stats(r, period.label, include_bootstraps=include_bootstraps)
+        if ys.commits_total > 0:
+            repos_with_commits += 1
+        if ys.commits_me > 0:
+            repos_with_my_commits += 1
+
+        if _is_new_project(r, period):
+            new_projects_by_history += 1
+            if _started_by_me(r, me):
+                new_projects_started_by_me += 1
+
+        total.commits_total += ys.commits_total
+        total.commits_me += ys.commits_me
+        total.insertions_total += ys.insertions_total
+        total.deletions_total += ys.deletions_total
+        total.insertions_me += ys.insertions_me
+        total.deletions_me += ys.deletions_me
+
+    return _period_aggregate(
+        period,
+        total,
+        repos_total=len(repos),
+        repos_with_commits=repos_with_commits,
+        repos_with_my_commits=repos_with_my_commits,
+        new_projects_by_history=new_projects_by_history,
+        new_projects_started_by_me=new_projects_started_by_me,
+    )
+
+
+def aggregate_period_variants(repos: list[RepoResult], period: Period, me: MeMatcher) -> tuple[dict, dict, dict]:
+    """Excluding-bootstraps, bootstraps-only and including-bootstraps period aggregates from one pass over `repos`."""
+    totals = (RepoYearStats(), RepoYearStats(), RepoYearStats())
+    with_commits = [0, 0, 0]
+    with_my_commits = [0, 0, 0]
+    new_projects_by_history = 0
+    new_projects_started_by_me = 0
+    no_stats = RepoYearStats()
 
-    # Convert to plain dicts with derived fields.
+    for r in repos:
+        ys_excl = r.period_stats_excl_bootstraps.get(period.label, no_stats)
+        ys_boot = r.period_stats_bootstraps.get(period.label, no_stats)
+        ys_incl = RepoYearStats()
+        add_repo_year_stats(ys_incl, ys_excl)
+        add_repo_year_stats(ys_incl, ys_boot)
+        for i, ys in enumerate((ys_excl, ys_boot, ys_incl)):
+            if ys.commits_total > 0:
+                with_commits[i] += 1
+            if ys.commits_me > 0:
+                with_my_commits[i] += 1
+            add_repo_year_stats(totals[i], ys)
+
+        if _is_new_project(r, period):
+            new_projects_by_history += 1
+            if _started_by_me(r, me):
+                new_projects_started_by_me += 1
+
+    excl, boot, incl = (
+        _period_aggregate(
+            period,
+            totals[i],
+            repos_total=len(repos),
+            repos_with_commits=with_commits[i],
+            repos_with_my_commits=with_my_commits[i],
+            new_projects_by_history=new_projects_by_history,
+            new_projects_started_by_me=new_projects_started_by_me,
+        )
+        for i in range(3)
+    )
+    return excl, boot, incl
+
+
+def _add_breakdown(breakdown: dict[str, dict[str, int]], *targets: dict[str, list[int]]) -> None:
+    # Positional [ins, del, ins_me, del_me] rows: one list per key instead of a dict rewritten field by field.
+    for key, st in breakdown.items():
+        ins = int(st.get("insertions", 0))
+        dele = int(st.get("deletions", 0))
+        ins_me = int(st.get("insertions_me", 0))
+        dele_me = int(st.get("deletions_me", 0))
+        for rows in targets:
+            row = rows.get(key)
+            if row is None:
+                rows[key] = [ins, dele, ins_me, dele_me]
+            else:
+                row[0] += ins
+                row[1] += dele
+                row[2] += ins_me
+                row[3] += dele_me
+
+
+def _breakdown_dicts(rows: dict[str, list[int]]) -> dict[str, dict[str, int]]:
     out: dict[str, dict[str, int]] = {}
-    for lang, st in agg.items():
-        ins = st["insertions"]
-        dele = st["deletions"]
-        ins_me = st["insertions_me"]
-        dele_me = st["deletions_me"]
-        out[lang] = {
+    for key, (ins, dele, ins_me, dele_me) in rows.items():
+        out[key] = {
             "insertions": ins,
             "deletions": dele,
             "changed": ins + dele,
@@ -414,6 +485,63 @@ def aggregate_languages(
     return out
 
 
+def _sum_breakdowns(breakdowns: Iterable[dict[str, dict[str, int]]]) -> dict[str, dict[str, int]]:
+    """Sum {key: {insertions, deletions, insertions_me, deletions_me}} maps and add the derived columns."""
+    rows: dict[str, list[int]] = {}
+    for breakdown in breakdowns:
+        _add_breakdown(breakdown, rows)
+    return _breakdown_dicts(rows)
+
+
+def _breakdown_variants(
+    excl_by_period: Iterable[dict[str, dict[str, dict[str, int]]]],
+    boot_by_period: Iterable[dict[str, dict[str, dict[str, int]]]],
+    period_label: str,
+) -> tuple[dict[str, dict[str, int]], dict[str, dict[str, int]], dict[str, dict[str, int]]]:
+    # Each repo's breakdown is read once and added to its own variant and to the combined one; key order
+    # matches the separate excl / bootstraps_only / include_bootstraps passes.
+    excl_rows: dict[str, list[int]] = {}
+    boot_rows: dict[str, list[int]] = {}
+    incl_rows: dict[str, list[int]] = {}
+    for excl, boot in zip(excl_by_period, boot_by_period):
+        _add_breakdown(excl.get(period_label, {}), excl_rows, incl_rows)
+        _add_breakdown(boot.get(period_label, {}), boot_rows, incl_rows)
+    return _breakdown_dicts(excl_rows), _breakdown_dicts(boot_rows), _breakdown_dicts(incl_rows)
+
+
+def _period_breakdowns(
+    excl_by_period: Iterable[dict[str, dict[str, dict[str, int]]]],
+    boot_by_period: Iterable[dict[str, dict[str, dict[str, int]]]],
+    period_label: str,
+    *,
+    include_bootstraps: bool,
+    bootstraps_only: bool,
+) -> Iterator[dict[str, dict[str, int]]]:
+    for excl, boot in zip(excl_by_period, boot_by_period):
+        if not bootstraps_only:
+            yield excl.get(period_label, {})
+        if bootstraps_only or include_bootstraps:
+            yield boot.get(period_label, {})
+
+
+def aggregate_languages(
+    repos: list[RepoResult],
+    period_label: str,
+    *,
+    include_bootstraps: bool,
+    bootstraps_only: bool = False,
+) -> dict[str, dict[str, int]]:
+    return _sum_breakdowns(
+        _period_breakdowns(
+            (r.languages_by_period_excl_bootstraps for r in repos),
+            (r.languages_by_period_bootstraps for r in repos),
+            period_label,
+            include_bootstraps=include_bootstraps,
+            bootstraps_only=bootstraps_only,
+        )
+    )
+
+
 def aggregate_dirs(
     repos: list[RepoResult],
     period_label: str,
@@ -421,41 +549,42 @@ def aggregate_dirs(
     include_bootstraps: bool,
     bootstraps_only: bool = False,
 ) -> dict[str, dict[str, int]]:
-    agg: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"insertions": 0, "deletions": 0, "insertions_me": 0, "deletions_me": 0}
+    return _sum_breakdowns(
+        _period_breakdowns(
+            (r.dirs_by_period_excl_bootstraps for r in repos),
+            (r.dirs_by_period_bootstraps for r in repos),
+            period_label,
+            include_bootstraps=include_bootstraps,
+            bootstraps_only=bootstraps_only,
+        )
     )
-    for r in repos:
-        if bootstraps_only:
-            merge_breakdown(agg, r.dirs_by_period_bootstraps.get(period_label, {}))
-        else:
-            merge_breakdown(agg, r.dirs_by_period_excl_bootstraps.get(period_label, {}))
-            if include_bootstraps:
-                merge_breakdown(agg, r.dirs_by_period_bootstraps.get(period_label, {}))
 
-    out: dict[str, dict[str, int]] = {}
-    for d, st in agg.items():
-        ins = st["insertions"]
-        dele = st["deletions"]
-        ins_me = st["insertions_me"]
-        dele_me = st["deletions_me"]
-        out[d] = {
-            "insertions": ins,
-            "deletions": dele,
-            "changed": ins + dele,
-            "insertions_me": ins_me,
-            "deletions_me": dele_me,
-            "changed_me": ins_me + dele_me,
-            "insertions_others": ins - ins_me,
-            "deletions_others": dele - dele_me,
-            "changed_others": (ins + dele) - (ins_me + dele_me),
-        }
-    return out
+
+def aggregate_languages_variants(
+    repos: list[RepoResult], period_label: str
+) -> tuple[dict[str, dict[str, int]], dict[str, dict[str, int]], dict[str, dict[str, int]]]:
+    """Excluding-bootstraps, bootstraps-only and including-bootstraps language breakdowns from one pass over `repos`."""
+    return _breakdown_variants(
+        (r.languages_by_period_excl_bootstraps for r in repos),
+        (r.languages_by_period_bootstraps for r in repos),
+        period_label,
+    )
+
+
+def aggregate_dirs_variants(
+    repos: list[RepoResult], period_label: str
+) -> tuple[dict[str, dict[str, int]], dict[str, dict[str, int]], dict[str, dict[str, int]]]:
+    """Excluding-bootstraps, bootstraps-only and including-bootstraps directory breakdowns from one pass over `repos`."""
+    return _breakdown_variants(
+        (r.dirs_by_period_excl_bootstraps for r in repos),
+        (r.dirs_by_period_bootstraps for r in repos),
+        period_label,
+    )
 
 
 def aggregate_excluded(repos: list[RepoResult], period_label: str) -> dict[str, int]:
-    agg: dict[str, int] = defaultdict(int)
+    # The per-repo counters are already ints (see _PeriodAccumulator.excluded), so Counter can sum them as-is.
+    agg: Counter[str] = Counter()
     for r in repos:
-        ex = r.excluded_by_period.get(period_label, {})
-        for k, v in ex.items():
-            agg[k] += int(v)
+        agg.update(r.excluded_by_period.get(period_label, {}))
     return dict(agg)
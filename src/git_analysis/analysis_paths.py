@@ -1,97 +1,115 @@
 from __future__ import annotations
 
 import fnmatch
-from pathlib import Path
+import functools
+import re
+from collections.abc import Callable
 
+# Paths repeat across commits (the same files get edited over and over), so the per-row helpers are memoized.
+_PATH_CACHE_SIZE = 200_000
 
-def should_exclude_path(path: str, exclude_prefixes: list[str], exclude_globs: list[str]) -> bool:
-    p = path.replace("\\", "/").lstrip("./")
+_LANGUAGE_BY_EXT = {
+    ".py": "Python",
+    ".ipynb": "Jupyter",
+    ".js": "JavaScript",
+    ".jsx": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".mjs": "JavaScript",
+    ".cjs": "JavaScript",
+    ".java": "Java",
+    ".kt": "Kotlin",
+    ".swift": "Swift",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".php": "PHP",
+    ".rb": "Ruby",
+    ".cs": "C#",
+    ".c": "C",
+    ".h": "C/C++ Headers",
+    ".cpp": "C++",
+    ".hpp": "C++",
+    ".mm": "Objective-C++",
+    ".m": "Objective-C",
+    ".scala": "Scala",
+    ".sql": "SQL",
+    ".tf": "Terraform",
+    ".yml": "YAML",
+    ".yaml": "YAML",
+    ".json": "JSON",
+    ".toml": "TOML",
+    ".ini": "INI",
+    ".md": "Markdown",
+    ".rst": "reStructuredText",
+    ".html": "HTML",
+    ".htm": "HTML",
+    ".css": "CSS",
+    ".scss": "SCSS",
+    ".sass": "Sass",
+    ".less": "Less",
+    ".sh": "Shell",
+    ".bash": "Shell",
+    ".zsh": "Shell",
+    ".ps1": "PowerShell",
+    ".bat": "Batch",
+    ".dockerignore": "Docker",
+    ".gradle": "Gradle",
+    ".xml": "XML",
+    ".proto": "Protobuf",
+}
+
+
+def _never(_path: str) -> bool:
+    return False
+
+
+@functools.lru_cache(maxsize=32)
+def build_exclude_matcher(exclude_prefixes: tuple[str, ...], exclude_globs: tuple[str, ...]) -> Callable[[str], bool]:
+    """Fold the prefix and glob exclusions into one regex and return a predicate over numstat paths."""
+    alternatives: list[str] = []
+    prefixes: list[str] = []
     for pref in exclude_prefixes:
         pr = (pref or "").replace("\\", "/").lstrip("./")
         if not pr:
             continue
         if not pr.endswith("/"):
             pr = pr + "/"
-        if p.startswith(pr) or f"/{pr}" in p:
-            return True
-    for pat in exclude_globs:
-        if pat and fnmatch.fnmatch(p, pat):
-            return True
-    return False
+        prefixes.append(re.escape(pr))
+    if prefixes:
+        # A prefix matches at the start of the path or right after any "/" (i.e. at any directory level).
+        alternatives.append(f"(?s:(?:.*/)?(?:{'|'.join(prefixes)}))")
+    alternatives.extend(f"(?:{fnmatch.translate(pat)})" for pat in exclude_globs if pat)
+    if not alternatives:
+        return _never
+    match = re.compile("|".join(alternatives)).match
+
+    def is_excluded(path: str) -> bool:
+        return match(path.replace("\\", "/").lstrip("./")) is not None
 
+    return is_excluded
 
-def normalize_numstat_path(path: str) -> str:
-    p = path.strip()
-    # `git log --numstat` may render renames like: src/{old => new}/file.py or src/{old.py => new.py}
-    if " => " in p:
-        p = p.replace("{", "").replace("}", "")
-        p = p.split(" => ")[-1]
-    return p.strip()
+
+def should_exclude_path(path: str, exclude_prefixes: list[str], exclude_globs: list[str]) -> bool:
+    return build_exclude_matcher(tuple(exclude_prefixes), tuple(exclude_globs))(path)
 
 
+@functools.lru_cache(maxsize=_PATH_CACHE_SIZE)
 def language_for_path(path: str) -> str:
     p = path.replace("\\", "/")
-    base = p.rsplit("/", 1)[-1]
-    if base == "Dockerfile" or base.lower().startswith("dockerfile."):
+    base = p[p.rfind("/") + 1 :]
+    if base == "Dockerfile" or base[:11].lower() == "dockerfile.":
         return "Dockerfile"
     if base == "Makefile" or base == "makefile":
         return "Makefile"
 
-    ext = Path(base).suffix.lower()
-    by_ext = {
-        ".py": "Python",
-        ".ipynb": "Jupyter",
-        ".js": "JavaScript",
-        ".jsx": "JavaScript",
-        ".ts": "TypeScript",
-        ".tsx": "TypeScript",
-        ".mjs": "JavaScript",
-        ".cjs": "JavaScript",
-        ".java": "Java",
-        ".kt": "Kotlin",
-        ".swift": "Swift",
-        ".go": "Go",
-        ".rs": "Rust",
-        ".php": "PHP",
-        ".rb": "Ruby",
-        ".cs": "C#",
-        ".c": "C",
-        ".h": "C/C++ Headers",
-        ".cpp": "C++",
-        ".hpp": "C++",
-        ".mm": "Objective-C++",
-        ".m": "Objective-C",
-        ".scala": "Scala",
-        ".sql": "SQL",
-        ".tf": "Terraform",
-        ".yml": "YAML",
-        ".yaml": "YAML",
-        ".json": "JSON",
-        ".toml": "TOML",
-        ".ini": "INI",
-        ".md": "Markdown",
-        ".rst": "reStructuredText",
-        ".html": "HTML",
-        ".htm": "HTML",
-        ".css": "CSS",
-        ".scss": "SCSS",
-        ".sass": "Sass",
-        ".less": "Less",
-        ".sh": "Shell",
-        ".bash": "Shell",
-        ".zsh": "Shell",
-        ".ps1": "PowerShell",
-        ".bat": "Batch",
-        ".dockerignore": "Docker",
-        ".gradle": "Gradle",
-        ".xml": "XML",
-        ".proto": "Protobuf",
-    }
-    if ext in by_ext:
-        return by_ext[ext]
-    return "Other"
+    # Same rule as Path.suffix: the last dot counts unless it leads or ends the name.
+    dot = base.rfind(".")
+    if dot <= 0 or dot == len(base) - 1:
+        return "Other"
+    return _LANGUAGE_BY_EXT.get(base[dot:].lower(), "Other")
 
 
+@functools.lru_cache(maxsize=_PATH_CACHE_SIZE)
 def dir_key_for_path(path: str, depth: int = 1) -> str:
     p = path.replace("\\", "/").lstrip("./")
     if not p or "/" not in p:
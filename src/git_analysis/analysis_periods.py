@@ -3,6 +3,10 @@ from __future__ import annotations
 import argparse
 import dataclasses
 import datetime as dt
+import re
+
+_SLUG_UNSAFE = re.compile(r"[^\w-]+")
+_SLUG_DASHES = re.compile(r"-{2,}")
 
 
 @dataclasses.dataclass(frozen=True)
@@ -39,18 +43,8 @@ def parse_period(spec: str) -> Period:
 
 
 def slugify(s: str) -> str:
-    s = (s or "").strip()
-    out: list[str] = []
-    for ch in s:
-        if ch.isalnum() or ch in ("-", "_"):
-            out.append(ch)
-        elif ch in (" ", ".", ":", "/", "\\"):
-            out.append("-")
-        else:
-            out.append("-")
-    slug = "".join(out).strip("-")
-    while "--" in slug:
-        slug = slug.replace("--", "-")
+    # \w is str.isalnum() plus "_", so non-ASCII letters and digits survive as before.
+    slug = _SLUG_DASHES.sub("-", _SLUG_UNSAFE.sub("-", (s or "").strip())).strip("-")
     return slug or "run"
 
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+from heapq import nsmallest
 from pathlib import Path
 
 from .analysis_aggregate import repo_period_stats
@@ -16,6 +18,8 @@ YEAR_IN_REVIEW_BANNER = r"""
 _HUMAN_UNITS = ["", "K", "M", "B", "T"]
 
 
+# Report renderers format the same counts (0 above all) over and over.
+@functools.lru_cache(maxsize=4096)
 def fmt_int(n: int) -> str:
     n_int = int(n)
     if n_int == 0:
@@ -69,13 +73,41 @@ def trunc(s: str, max_len: int) -> str:
     return s[: max_len - 1] + "…"
 
 
-def bar(value: int, max_value: int, width: int = 22) -> str:
-    if max_value <= 0:
-        filled = 0
+@functools.lru_cache(maxsize=8)
+def _bar_strings(width: int) -> tuple[str, ...]:
+    return tuple("[" + ("#" * filled) + ("-" * (width - filled)) + "]" for filled in range(width + 1))
+
+
+_DEFAULT_BAR_WIDTH = 22
+# Every renderer uses the default width; keep its table at hand instead of going through the cache.
+_DEFAULT_BAR_STRINGS = _bar_strings(_DEFAULT_BAR_WIDTH)
+
+
+def bar(value: int, max_value: int, width: int = _DEFAULT_BAR_WIDTH) -> str:
+    if width == _DEFAULT_BAR_WIDTH:
+        strings = _DEFAULT_BAR_STRINGS
     else:
-        filled = int(round((value / max_value) * width))
-    filled = max(0, min(width, filled))
-    return "[" + ("#" * filled) + ("-" * (width - filled)) + "]"
+        width = max(0, width)
+        strings = _bar_strings(width)
+    if max_value <= 0:
+        return strings[0]
+    filled = int(round((value / max_value) * width))
+    return strings[max(0, min(width, filled))]
+
+
+# Label and year_agg key prefix of each "Totals" row in the year-in-review report.
+_TOTALS_ROWS = (
+    ("Commits:", "commits"),
+    ("Lines changed:", "changed"),
+    ("Insertions:", "insertions"),
+    ("Deletions:", "deletions"),
+)
+_TOTALS_KEYS = tuple(f"{key}_{who}" for _, key in _TOTALS_ROWS for who in ("total", "me", "others"))
+
+
+def top_items_by(d: dict[str, dict[str, int]], metric_key: str, n: int) -> list[tuple[str, dict[str, int]]]:
+    # Same order as sorted(...)[:n] (largest metric first, then name), without sorting the whole mapping.
+    return nsmallest(n, d.items(), key=lambda kv: (-int(kv[1].get(metric_key, 0)), kv[0].lower()))
 
 
 def repo_label(r: RepoResult) -> str:
@@ -104,19 +136,16 @@ def render_year_in_review(
     top_n: int,
     me: MeMatcher,
 ) -> str:
-    lines: list[str] = []
-    lines.append(YEAR_IN_REVIEW_BANNER)
-    lines.append("")
-    lines.append(f"YEAR IN REVIEW: {period.label}")
-    lines.append(f"Range: {period.start_iso} -> {period.end_iso} (exclusive end)")
-    lines.append("")
-    lines.append(
-        f"Repos analyzed: {fmt_int(int(year_agg.get('repos_total', 0)))} (dedupe={dedupe}, merges={'yes' if include_merges else 'no'}, refs=all)"
-    )
-    lines.append(
+    lines: list[str] = [
+        YEAR_IN_REVIEW_BANNER,
+        "",
+        f"YEAR IN REVIEW: {period.label}",
+        f"Range: {period.start_iso} -> {period.end_iso} (exclusive end)",
+        "",
+        f"Repos analyzed: {fmt_int(int(year_agg.get('repos_total', 0)))} (dedupe={dedupe}, merges={'yes' if include_merges else 'no'}, refs=all)",
         f"Bootstraps: {'included' if include_bootstraps else 'excluded'} "
-        f"(thresholds: changed>={fmt_int(bootstrap_cfg.changed_threshold)}, files>={fmt_int(bootstrap_cfg.files_threshold)}, dominance>={bootstrap_cfg.addition_ratio:.2f})"
-    )
+        f"(thresholds: changed>={fmt_int(bootstrap_cfg.changed_threshold)}, files>={fmt_int(bootstrap_cfg.files_threshold)}, dominance>={bootstrap_cfg.addition_ratio:.2f})",
+    ]
     if include_remote_prefixes:
         lines.append(f"Remote filter: {', '.join(include_remote_prefixes)}")
     if exclude_path_prefixes or exclude_path_globs:
@@ -125,25 +154,11 @@ def render_year_in_review(
             + ", ".join([*exclude_path_prefixes, *exclude_path_globs][:6])
             + (" ..." if (len(exclude_path_prefixes) + len(exclude_path_globs)) > 6 else "")
         )
-    lines.append("")
-    lines.append("Totals")
-    lines.append("-" * 72)
-    lines.append(
-        f"Commits:        {fmt_int(int(year_agg.get('commits_total', 0))):>12}  "
-        f"(me {fmt_int(int(year_agg.get('commits_me', 0))):>10}, others {fmt_int(int(year_agg.get('commits_others', 0))):>10})"
-    )
-    lines.append(
-        f"Lines changed:  {fmt_int(int(year_agg.get('changed_total', 0))):>12}  "
-        f"(me {fmt_int(int(year_agg.get('changed_me', 0))):>10}, others {fmt_int(int(year_agg.get('changed_others', 0))):>10})"
-    )
-    lines.append(
-        f"Insertions:     {fmt_int(int(year_agg.get('insertions_total', 0))):>12}  "
-        f"(me {fmt_int(int(year_agg.get('insertions_me', 0))):>10}, others {fmt_int(int(year_agg.get('insertions_others', 0))):>10})"
-    )
-    lines.append(
-        f"Deletions:      {fmt_int(int(year_agg.get('deletions_total', 0))):>12}  "
-        f"(me {fmt_int(int(year_agg.get('deletions_me', 0))):>10}, others {fmt_int(int(year_agg.get('deletions_others', 0))):>10})"
-    )
+    lines += ["", "Totals", "-" * 72]
+    totals = tuple(year_agg.get(k, 0) for k in _TOTALS_KEYS)
+    for i, (label, _) in enumerate(_TOTALS_ROWS):
+        total, mine, others = (int(v) for v in totals[3 * i : 3 * i + 3])
+        lines.append(f"{label:<16}{fmt_int(total):>12}  (me {fmt_int(mine):>10}, others {fmt_int(others):>10})")
     if include_bootstraps and int(year_agg_bootstraps.get("changed_total", 0)) > 0:
         lines.append(
             f"Bootstraps:     {fmt_int(int(year_agg_bootstraps.get('changed_total', 0))):>12}  "
@@ -154,36 +169,36 @@ def render_year_in_review(
             f"Excluded lines: {fmt_int(int(excluded.get('excluded_changed', 0))):>12}  "
             f"(files {fmt_int(int(excluded.get('excluded_files', 0)))})"
         )
-    lines.append("")
-    lines.append(
+    lines += [
+        "",
         f"Active repos:   {fmt_int(int(year_agg.get('repos_with_commits', 0)))} "
         f"(mine: {fmt_int(int(year_agg.get('repos_with_my_commits', 0)))}), "
         f"new projects: {fmt_int(int(year_agg.get('new_projects_by_history', 0)))} "
-        f"(started by me: {fmt_int(int(year_agg.get('new_projects_started_by_me', 0)))})"
-    )
-    lines.append("")
+        f"(started by me: {fmt_int(int(year_agg.get('new_projects_started_by_me', 0)))})",
+        "",
+    ]
 
     # Languages
     lines.append("Top languages (changed lines)")
     lines.append("-" * 72)
-    langs_sorted = sorted(languages.items(), key=lambda kv: (-int(kv[1].get("changed", 0)), kv[0].lower()))
-    max_changed = int(langs_sorted[0][1].get("changed", 0)) if langs_sorted else 0
-    for lang, st in langs_sorted[:top_n]:
+    top_langs = top_items_by(languages, "changed", top_n)
+    max_changed = int(top_langs[0][1].get("changed", 0)) if top_langs else 0
+    for lang, st in top_langs:
         changed = int(st.get("changed", 0))
         lines.append(f"{trunc(lang, 20):20} {fmt_int(changed):>12}  {bar(changed, max_changed)}")
-    if not langs_sorted:
+    if not languages:
         lines.append("(no file changes detected)")
     lines.append("")
 
     # Directories
     lines.append("Top directories (changed lines)")
     lines.append("-" * 72)
-    dirs_sorted = sorted(dirs.items(), key=lambda kv: (-int(kv[1].get("changed", 0)), kv[0].lower()))
-    max_dir = int(dirs_sorted[0][1].get("changed", 0)) if dirs_sorted else 0
-    for d, st in dirs_sorted[:top_n]:
+    top_dirs = top_items_by(dirs, "changed", top_n)
+    max_dir = int(top_dirs[0][1].get("changed", 0)) if top_dirs else 0
+    for d, st in top_dirs:
         changed = int(st.get("changed", 0))
         lines.append(f"{trunc(d, 20):20} {fmt_int(changed):>12}  {bar(changed, max_dir)}")
-    if not dirs_sorted:
+    if not dirs:
         lines.append("(no directories detected)")
     lines.append("")
 
@@ -194,9 +209,9 @@ def render_year_in_review(
     for r in repos:
         ys = repo_period_stats(r, period.label, include_bootstraps=include_bootstraps)
         repo_items.append((ys.changed_total, r))
-    repo_items.sort(key=lambda t: (-t[0], repo_label(t[1]).lower()))
-    max_repo = repo_items[0][0] if repo_items else 0
-    for changed, r in repo_items[:top_n]:
+    top_repos = nsmallest(top_n, repo_items, key=lambda t: (-t[0], repo_label(t[1]).lower()))
+    max_repo = top_repos[0][0] if top_repos else 0
+    for changed, r in top_repos:
         label = trunc(repo_label(r), 44)
         lines.append(f"{label:44} {fmt_int(changed):>12}  {bar(changed, max_repo)}")
     if not repo_items:
@@ -206,7 +221,8 @@ def render_year_in_review(
     # Authors
     lines.append("Top authors (commits)")
     lines.append("-" * 72)
-    author_items = sorted(authors.values(), key=lambda a: (-a.commits, -a.changed, (a.email or "").lower()))
+    # The loop below always prints at least one author before checking top_n.
+    author_items = nsmallest(max(top_n, 1), authors.values(), key=lambda a: (-a.commits, -a.changed, (a.email or "").lower()))
     shown = 0
     for a in author_items:
         is_me = me.matches(a.name, a.email)
@@ -257,7 +273,7 @@ def render_yoy_year_in_review(
     lines.append("-" * 72)
 
     def top_langs(d: dict[str, dict[str, int]]) -> list[str]:
-        return [k for k, _ in sorted(d.items(), key=lambda kv: (-int(kv[1].get("changed", 0)), kv[0].lower()))[:top_n]]
+        return [k for k, _ in top_items_by(d, "changed", top_n)]
 
     candidate: list[str] = []
     for l in top_langs(langs0) + top_langs(langs1):
@@ -287,6 +303,58 @@ def pct_change(old: int, new: int) -> str:
     return f"{sign}{fmt_int(rounded)}%"
 
 
+# (metric label, aggregate key) rows of the comparison report's delta tables.
+_COMPARISON_TOTAL_ROWS = (
+    ("Repos with commits", "repos_with_commits"),
+    ("Repos with my commits", "repos_with_my_commits"),
+    ("New projects (history)", "new_projects_by_history"),
+    ("New projects started by me", "new_projects_started_by_me"),
+    ("Commits (total)", "commits_total"),
+    ("Commits (me)", "commits_me"),
+    ("Commits (others)", "commits_others"),
+    ("Lines changed (total)", "changed_total"),
+    ("Lines changed (me)", "changed_me"),
+    ("Lines changed (others)", "changed_others"),
+    ("Insertions (total)", "insertions_total"),
+    ("Insertions (me)", "insertions_me"),
+    ("Insertions (others)", "insertions_others"),
+    ("Deletions (total)", "deletions_total"),
+    ("Deletions (me)", "deletions_me"),
+    ("Deletions (others)", "deletions_others"),
+)
+_COMPARISON_BOOT_ROWS = (
+    ("Repos with commits", "repos_with_commits"),
+    ("Repos with my commits", "repos_with_my_commits"),
+    ("Commits (total)", "commits_total"),
+    ("Commits (me)", "commits_me"),
+    ("Lines changed (total)", "changed_total"),
+    ("Lines changed (me)", "changed_me"),
+    ("Insertions (total)", "insertions_total"),
+    ("Deletions (total)", "deletions_total"),
+)
+_COMPARISON_INCL_ROWS = (
+    ("Repos with commits", "repos_with_commits"),
+    ("Repos with my commits", "repos_with_my_commits"),
+    ("New projects (history)", "new_projects_by_history"),
+    ("New projects started by me", "new_projects_started_by_me"),
+    ("Commits (total)", "commits_total"),
+    ("Commits (me)", "commits_me"),
+    ("Lines changed (total)", "changed_total"),
+    ("Lines changed (me)", "changed_me"),
+    ("Insertions (total)", "insertions_total"),
+    ("Deletions (total)", "deletions_total"),
+)
+
+
+def delta_table_rows(y0: dict, y1: dict, rows: tuple[tuple[str, str], ...], *, missing_as_zero: bool = False) -> list[str]:
+    out: list[str] = []
+    for metric, key in rows:
+        old = int(y0.get(key, 0) if missing_as_zero else y0[key])
+        new = int(y1.get(key, 0) if missing_as_zero else y1[key])
+        out.append(f"| {metric} | {fmt_int(old)} | {fmt_int(new)} | {fmt_signed_int(new-old)} | {pct_change(old, new)} |")
+    return out
+
+
 def write_comparison_md(
     path: Path,
     y0: dict,
@@ -306,7 +374,7 @@ def write_comparison_md(
     top_languages: int = 15,
     top_dirs: int = 20,
     include_bootstraps: bool = False,
-) -> None:
+) -> str:
     a = str(y0.get("period") or y0.get("year"))
     b = str(y1.get("period") or y1.get("year"))
 
@@ -320,32 +388,12 @@ def write_comparison_md(
     lines.append(f"| Metric | {a} | {b} | Δ | Δ% |")
     lines.append("|---|---:|---:|---:|---:|")
 
-    def row(metric: str, key: str) -> None:
-        old = int(y0[key])
-        new = int(y1[key])
-        lines.append(f"| {metric} | {fmt_int(old)} | {fmt_int(new)} | {fmt_signed_int(new-old)} | {pct_change(old, new)} |")
-
-    row("Repos with commits", "repos_with_commits")
-    row("Repos with my commits", "repos_with_my_commits")
-    row("New projects (history)", "new_projects_by_history")
-    row("New projects started by me", "new_projects_started_by_me")
-    row("Commits (total)", "commits_total")
-    row("Commits (me)", "commits_me")
-    row("Commits (others)", "commits_others")
-    row("Lines changed (total)", "changed_total")
-    row("Lines changed (me)", "changed_me")
-    row("Lines changed (others)", "changed_others")
-    row("Insertions (total)", "insertions_total")
-    row("Insertions (me)", "insertions_me")
-    row("Insertions (others)", "insertions_others")
-    row("Deletions (total)", "deletions_total")
-    row("Deletions (me)", "deletions_me")
-    row("Deletions (others)", "deletions_others")
+    lines.extend(delta_table_rows(y0, y1, _COMPARISON_TOTAL_ROWS))
     lines.append("")
 
     def top_union_keys(d0: dict[str, dict[str, int]], d1: dict[str, dict[str, int]], metric_key: str, limit: int) -> list[str]:
-        by0 = sorted(d0.items(), key=lambda kv: (-int(kv[1].get(metric_key, 0)), kv[0].lower()))[:limit]
-        by1 = sorted(d1.items(), key=lambda kv: (-int(kv[1].get(metric_key, 0)), kv[0].lower()))[:limit]
+        by0 = top_items_by(d0, metric_key, limit)
+        by1 = top_items_by(d1, metric_key, limit)
         candidates = {k for k, _ in by0} | {k for k, _ in by1}
         return sorted(
             candidates,
@@ -368,25 +416,12 @@ def write_comparison_md(
             ),
         )
 
-    def boot_row(metric: str, key: str) -> None:
-        assert y0_boot is not None and y1_boot is not None
-        old = int(y0_boot.get(key, 0))
-        new = int(y1_boot.get(key, 0))
-        lines.append(f"| {metric} | {fmt_int(old)} | {fmt_int(new)} | {fmt_signed_int(new-old)} | {pct_change(old, new)} |")
-
     if y0_boot is not None and y1_boot is not None:
         lines.append("## Bootstraps (totals)")
         lines.append("")
         lines.append(f"| Metric | {a} | {b} | Δ | Δ% |")
         lines.append("|---|---:|---:|---:|---:|")
-        boot_row("Repos with commits", "repos_with_commits")
-        boot_row("Repos with my commits", "repos_with_my_commits")
-        boot_row("Commits (total)", "commits_total")
-        boot_row("Commits (me)", "commits_me")
-        boot_row("Lines changed (total)", "changed_total")
-        boot_row("Lines changed (me)", "changed_me")
-        boot_row("Insertions (total)", "insertions_total")
-        boot_row("Deletions (total)", "deletions_total")
+        lines.extend(delta_table_rows(y0_boot, y1_boot, _COMPARISON_BOOT_ROWS, missing_as_zero=True))
         lines.append("")
 
     if y0_incl is not None and y1_incl is not None:
@@ -394,97 +429,42 @@ def write_comparison_md(
         lines.append("")
         lines.append(f"| Metric | {a} | {b} | Δ | Δ% |")
         lines.append("|---|---:|---:|---:|---:|")
-
-        def incl_row(metric: str, key: str) -> None:
-            old = int(y0_incl.get(key, 0))
-            new = int(y1_incl.get(key, 0))
-            lines.append(f"| {metric} | {fmt_int(old)} | {fmt_int(new)} | {fmt_signed_int(new-old)} | {pct_change(old, new)} |")
-
-        incl_row("Repos with commits", "repos_with_commits")
-        incl_row("Repos with my commits", "repos_with_my_commits")
-        incl_row("New projects (history)", "new_projects_by_history")
-        incl_row("New projects started by me", "new_projects_started_by_me")
-        incl_row("Commits (total)", "commits_total")
-        incl_row("Commits (me)", "commits_me")
-        incl_row("Lines changed (total)", "changed_total")
-        incl_row("Lines changed (me)", "changed_me")
-        incl_row("Insertions (total)", "insertions_total")
-        incl_row("Deletions (total)", "deletions_total")
+        lines.extend(delta_table_rows(y0_incl, y1_incl, _COMPARISON_INCL_ROWS, missing_as_zero=True))
         lines.append("")
 
-    if languages0 is not None and languages1 is not None:
-        lines.append(f"## Languages (changed lines, {'including' if include_bootstraps else 'excluding'} bootstraps)")
+    def breakdown_table(
+        title: str, column: str, d0: dict[str, dict[str, int]], d1: dict[str, dict[str, int]], metric_key: str, limit: int
+    ) -> None:
+        lines.append(f"## {title}")
         lines.append("")
-        lines.append(f"| Language | {a} | {b} | Δ | Δ% |")
+        lines.append(f"| {column} | {a} | {b} | Δ | Δ% |")
         lines.append("|---|---:|---:|---:|---:|")
-
         # Select the rows to include by volume (max of the two periods), then sort that fixed set by Δ%.
-        langs = top_union_keys(languages0, languages1, "changed", top_languages)[:top_languages]
-        for lang in sort_keys_by_pct_change(languages0, languages1, "changed", langs):
-            old = int(languages0.get(lang, {}).get("changed", 0))
-            new = int(languages1.get(lang, {}).get("changed", 0))
-            lines.append(f"| {lang} | {fmt_int(old)} | {fmt_int(new)} | {fmt_signed_int(new-old)} | {pct_change(old, new)} |")
+        keys = top_union_keys(d0, d1, metric_key, limit)[:limit]
+        for k in sort_keys_by_pct_change(d0, d1, metric_key, keys):
+            old = int(d0.get(k, {}).get(metric_key, 0))
+            new = int(d1.get(k, {}).get(metric_key, 0))
+            lines.append(f"| {k} | {fmt_int(old)} | {fmt_int(new)} | {fmt_signed_int(new-old)} | {pct_change(old, new)} |")
         lines.append("")
 
-        lines.append(f"## Languages (my changed lines, {'including' if include_bootstraps else 'excluding'} bootstraps)")
-        lines.append("")
-        lines.append(f"| Language | {a} | {b} | Δ | Δ% |")
-        lines.append("|---|---:|---:|---:|---:|")
-        langs = top_union_keys(languages0, languages1, "changed_me", top_languages)[:top_languages]
-        for lang in sort_keys_by_pct_change(languages0, languages1, "changed_me", langs):
-            old = int(languages0.get(lang, {}).get("changed_me", 0))
-            new = int(languages1.get(lang, {}).get("changed_me", 0))
-            lines.append(f"| {lang} | {fmt_int(old)} | {fmt_int(new)} | {fmt_signed_int(new-old)} | {pct_change(old, new)} |")
-        lines.append("")
+    bootstraps = "including" if include_bootstraps else "excluding"
+    if languages0 is not None and languages1 is not None:
+        breakdown_table(f"Languages (changed lines, {bootstraps} bootstraps)", "Language", languages0, languages1, "changed", top_languages)
+        breakdown_table(f"Languages (my changed lines, {bootstraps} bootstraps)", "Language", languages0, languages1, "changed_me", top_languages)
 
     if dirs0 is not None and dirs1 is not None:
-        lines.append(f"## Directories (changed lines, {'including' if include_bootstraps else 'excluding'} bootstraps)")
-        lines.append("")
-        lines.append(f"| Directory | {a} | {b} | Δ | Δ% |")
-        lines.append("|---|---:|---:|---:|---:|")
-        dirs = top_union_keys(dirs0, dirs1, "changed", top_dirs)[:top_dirs]
-        for d in sort_keys_by_pct_change(dirs0, dirs1, "changed", dirs):
-            old = int(dirs0.get(d, {}).get("changed", 0))
-            new = int(dirs1.get(d, {}).get("changed", 0))
-            lines.append(f"| {d} | {fmt_int(old)} | {fmt_int(new)} | {fmt_signed_int(new-old)} | {pct_change(old, new)} |")
-        lines.append("")
-
-        lines.append(f"## Directories (my changed lines, {'including' if include_bootstraps else 'excluding'} bootstraps)")
-        lines.append("")
-        lines.append(f"| Directory | {a} | {b} | Δ | Δ% |")
-        lines.append("|---|---:|---:|---:|---:|")
-        dirs = top_union_keys(dirs0, dirs1, "changed_me", top_dirs)[:top_dirs]
-        for d in sort_keys_by_pct_change(dirs0, dirs1, "changed_me", dirs):
-            old = int(dirs0.get(d, {}).get("changed_me", 0))
-            new = int(dirs1.get(d, {}).get("changed_me", 0))
-            lines.append(f"| {d} | {fmt_int(old)} | {fmt_int(new)} | {fmt_signed_int(new-old)} | {pct_change(old, new)} |")
-        lines.append("")
+        breakdown_table(f"Directories (changed lines, {bootstraps} bootstraps)", "Directory", dirs0, dirs1, "changed", top_dirs)
+        breakdown_table(f"Directories (my changed lines, {bootstraps} bootstraps)", "Directory", dirs0, dirs1, "changed_me", top_dirs)
 
     if languages0_boot is not None and languages1_boot is not None:
-        lines.append("## Languages (bootstraps, changed lines)")
-        lines.append("")
-        lines.append(f"| Language | {a} | {b} | Δ | Δ% |")
-        lines.append("|---|---:|---:|---:|---:|")
-        langs = top_union_keys(languages0_boot, languages1_boot, "changed", top_languages)[:top_languages]
-        for lang in sort_keys_by_pct_change(languages0_boot, languages1_boot, "changed", langs):
-            old = int(languages0_boot.get(lang, {}).get("changed", 0))
-            new = int(languages1_boot.get(lang, {}).get("changed", 0))
-            lines.append(f"| {lang} | {fmt_int(old)} | {fmt_int(new)} | {fmt_signed_int(new-old)} | {pct_change(old, new)} |")
-        lines.append("")
+        breakdown_table("Languages (bootstraps, changed lines)", "Language", languages0_boot, languages1_boot, "changed", top_languages)
 
     if dirs0_boot is not None and dirs1_boot is not None:
-        lines.append("## Directories (bootstraps, changed lines)")
-        lines.append("")
-        lines.append(f"| Directory | {a} | {b} | Δ | Δ% |")
-        lines.append("|---|---:|---:|---:|---:|")
-        dirs = top_union_keys(dirs0_boot, dirs1_boot, "changed", top_dirs)[:top_dirs]
-        for d in sort_keys_by_pct_change(dirs0_boot, dirs1_boot, "changed", dirs):
-            old = int(dirs0_boot.get(d, {}).get("changed", 0))
-            new = int(dirs1_boot.get(d, {}).get("changed", 0))
-            lines.append(f"| {d} | {fmt_int(old)} | {fmt_int(new)} | {fmt_signed_int(new-old)} | {pct_change(old, new)} |")
-        lines.append("")
+        breakdown_table("Directories (bootstraps, changed lines)", "Directory", dirs0_boot, dirs1_boot, "changed", top_dirs)
 
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    md = "\n".join(lines) + "\n"
+    path.write_text(md, encoding="utf-8")
+    return md
 
 
 def render_comparison_txt_from_md(md: str) -> str:
@@ -1,19 +1,59 @@
 from __future__ import annotations
 
+import dataclasses
 import datetime as dt
+import re
 import subprocess
+import sys
 import threading
 from collections import defaultdict
 from pathlib import Path
+from typing import IO, Iterator
 from heapq import heapify, heapreplace, heappush
 
-from .analysis_paths import dir_key_for_path, language_for_path, normalize_numstat_path, should_exclude_path
+from .analysis_paths import build_exclude_matcher, dir_key_for_path, language_for_path
 from .analysis_periods import Period
 from .git import get_first_commit, get_last_commit
 from .identity import MeMatcher, normalize_email
 from .models import AuthorStats, BootstrapConfig, RepoResult, RepoYearStats
 
 
+# One `-z` numstat record: "<added>\t<deleted>\t<path>", where binary files report "-" for both counts.
+# Renames leave <path> empty and follow with two more records: the old path, then the new one.
+_NUMSTAT_ROW = re.compile(rb"(\d+|-)\t(\d+|-)\t(.*)", re.DOTALL)
+_GIT_LOG_BUFFER = 1 << 20
+# Kernel pipe capacity requested for git's stdout (Linux only); larger pipes mean fewer wakeups per MiB of log.
+_GIT_LOG_PIPE_SIZE = 1 << 20
+
+
+def _popen_git_log(cmd: list[str], repo: Path) -> subprocess.Popen[bytes]:
+    kwargs: dict[str, object] = {
+        "cwd": str(repo),
+        "stdout": subprocess.PIPE,
+        "stderr": subprocess.PIPE,
+        "bufsize": _GIT_LOG_BUFFER,
+    }
+    try:
+        return subprocess.Popen(cmd, pipesize=_GIT_LOG_PIPE_SIZE, **kwargs)  # type: ignore[call-overload]
+    except PermissionError:
+        # fs.pipe-max-size is below the requested size for unprivileged users; keep the default pipe.
+        return subprocess.Popen(cmd, **kwargs)  # type: ignore[call-overload]
+
+
+def _iter_nul_records(stream: IO[bytes], chunk_size: int = _GIT_LOG_BUFFER) -> Iterator[bytes]:
+    """Yield the NUL-separated records of `stream` without holding the whole stream in memory."""
+    tail = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        records = (tail + chunk).split(b"\0")
+        tail = records.pop()
+        yield from records
+    if tail:
+        yield tail
+
+
 def _week_start_iso(commit_iso: str) -> str:
     s = (commit_iso or "").strip()
     if not s:
@@ -32,17 +72,8 @@ def _week_start_iso(commit_iso: str) -> str:
     return f"{week_start.isoformat()}T00:00:00Z"
 
 
-def parse_numstat_stream(
-    repo: Path,
-    period: Period,
-    include_merges: bool,
-    me: MeMatcher,
-    bootstrap: BootstrapConfig,
-    exclude_path_prefixes: list[str],
-    exclude_path_globs: list[str],
-    bootstrap_exclude_shas: set[str] | None = None,
-    exclude_commits: set[str] | None = None,
-) -> tuple[
+# Per-period parse result: the parse_numstat_stream tuple without its trailing errors list.
+PeriodStreamResult = tuple[
     RepoYearStats,  # excl bootstraps
     RepoYearStats,  # bootstraps only
     dict[str, dict[str, int]],  # weekly excl: week_start -> {commits,insertions,deletions}
@@ -66,293 +97,353 @@ def parse_numstat_stream(
     dict[str, int],  # excluded path counters
     list[dict[str, object]],  # bootstrap commits
     list[dict[str, object]],  # top commits by size
-    list[str],  # errors
-]:
-    start = f"{period.start_iso}T00:00:00Z"
-    end = f"{period.end_iso}T00:00:00Z"
+]
 
-    pretty = "@@@%H\t%an\t%ae\t%aI\t%s"
-    cmd = [
-        "git",
-        "log",
-        "--all",
-        f"--since={start}",
-        f"--before={end}",
-        "--date=iso-strict",
-        f"--pretty=format:{pretty}",
-        "--numstat",
-    ]
-    if not include_merges:
-        cmd.insert(2, "--no-merges")
 
-    stats_excl = RepoYearStats()
-    stats_boot = RepoYearStats()
-    weekly_excl: dict[str, dict[str, int]] = defaultdict(lambda: {"commits": 0, "insertions": 0, "deletions": 0})
-    weekly_boot: dict[str, dict[str, int]] = defaultdict(lambda: {"commits": 0, "insertions": 0, "deletions": 0})
-    weekly_tech_excl: dict[str, dict[str, dict[str, int]]] = defaultdict(lambda: defaultdict(lambda: {"commits": 0, "insertions": 0, "deletions": 0}))
-    weekly_tech_boot: dict[str, dict[str, dict[str, int]]] = defaultdict(lambda: defaultdict(lambda: {"commits": 0, "insertions": 0, "deletions": 0}))
-    me_weekly_excl: dict[str, dict[str, int]] = defaultdict(lambda: {"commits": 0, "insertions": 0, "deletions": 0})
-    me_weekly_boot: dict[str, dict[str, int]] = defaultdict(lambda: {"commits": 0, "insertions": 0, "deletions": 0})
-    me_weekly_tech_excl: dict[str, dict[str, dict[str, int]]] = defaultdict(
-        lambda: defaultdict(lambda: {"commits": 0, "insertions": 0, "deletions": 0})
-    )
-    me_weekly_tech_boot: dict[str, dict[str, dict[str, int]]] = defaultdict(
-        lambda: defaultdict(lambda: {"commits": 0, "insertions": 0, "deletions": 0})
+def _commit_counts() -> dict[str, int]:
+    return {"commits": 0, "insertions": 0, "deletions": 0}
+
+
+# Column order of the per-period language/dir rows; rows become {column: value} dicts only in result().
+_CHANGE_COLUMNS = ("insertions", "deletions", "insertions_me", "deletions_me")
+
+
+def _change_row() -> list[int]:
+    return [0, 0, 0, 0]
+
+
+def _change_dicts(rows: dict[str, list[int]]) -> dict[str, dict[str, int]]:
+    return {key: dict(zip(_CHANGE_COLUMNS, row)) for key, row in rows.items()}
+
+
+def _tech_commit_counts() -> defaultdict[str, dict[str, int]]:
+    return defaultdict(_commit_counts)
+
+
+def _period_bounds_ts(period: Period) -> tuple[int, int]:
+    # Same instants as the `--since=<start>T00:00:00Z --before=<end>T00:00:00Z` window git applies (both inclusive).
+    start = dt.datetime.combine(period.start, dt.time(), tzinfo=dt.timezone.utc)
+    end = dt.datetime.combine(period.end, dt.time(), tzinfo=dt.timezone.utc)
+    return int(start.timestamp()), int(end.timestamp())
+
+
+@dataclasses.dataclass
+class _PeriodAccumulator:
+    start_ts: int
+    end_ts: int
+    stats_excl: RepoYearStats = dataclasses.field(default_factory=RepoYearStats)
+    stats_boot: RepoYearStats = dataclasses.field(default_factory=RepoYearStats)
+    weekly_excl: defaultdict[str, dict[str, int]] = dataclasses.field(default_factory=lambda: defaultdict(_commit_counts))
+    weekly_boot: defaultdict[str, dict[str, int]] = dataclasses.field(default_factory=lambda: defaultdict(_commit_counts))
+    weekly_tech_excl: defaultdict[str, defaultdict[str, dict[str, int]]] = dataclasses.field(
+        default_factory=lambda: defaultdict(_tech_commit_counts)
     )
-    authors_excl: dict[str, AuthorStats] = {}
-    authors_boot: dict[str, AuthorStats] = {}
-    languages_excl: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"insertions": 0, "deletions": 0, "insertions_me": 0, "deletions_me": 0}
+    weekly_tech_boot: defaultdict[str, defaultdict[str, dict[str, int]]] = dataclasses.field(
+        default_factory=lambda: defaultdict(_tech_commit_counts)
     )
-    languages_boot: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"insertions": 0, "deletions": 0, "insertions_me": 0, "deletions_me": 0}
+    me_weekly_excl: defaultdict[str, dict[str, int]] = dataclasses.field(default_factory=lambda: defaultdict(_commit_counts))
+    me_weekly_boot: defaultdict[str, dict[str, int]] = dataclasses.field(default_factory=lambda: defaultdict(_commit_counts))
+    me_weekly_tech_excl: defaultdict[str, defaultdict[str, dict[str, int]]] = dataclasses.field(
+        default_factory=lambda: defaultdict(_tech_commit_counts)
     )
-    dirs_excl: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"insertions": 0, "deletions": 0, "insertions_me": 0, "deletions_me": 0}
+    me_weekly_tech_boot: defaultdict[str, defaultdict[str, dict[str, int]]] = dataclasses.field(
+        default_factory=lambda: defaultdict(_tech_commit_counts)
     )
-    dirs_boot: dict[str, dict[str, int]] = defaultdict(
-        lambda: {"insertions": 0, "deletions": 0, "insertions_me": 0, "deletions_me": 0}
+    authors_excl: dict[str, AuthorStats] = dataclasses.field(default_factory=dict)
+    authors_boot: dict[str, AuthorStats] = dataclasses.field(default_factory=dict)
+    languages_excl: defaultdict[str, list[int]] = dataclasses.field(default_factory=lambda: defaultdict(_change_row))
+    languages_boot: defaultdict[str, list[int]] = dataclasses.field(default_factory=lambda: defaultdict(_change_row))
+    dirs_excl: defaultdict[str, list[int]] = dataclasses.field(default_factory=lambda: defaultdict(_change_row))
+    dirs_boot: defaultdict[str, list[int]] = dataclasses.field(default_factory=lambda: defaultdict(_change_row))
+    me_monthly_excl: defaultdict[str, dict[str, int]] = dataclasses.field(default_factory=lambda: defaultdict(_commit_counts))
+    me_monthly_boot: defaultdict[str, dict[str, int]] = dataclasses.field(default_factory=lambda: defaultdict(_commit_counts))
+    me_monthly_tech_excl: defaultdict[str, defaultdict[str, dict[str, int]]] = dataclasses.field(
+        default_factory=lambda: defaultdict(_tech_commit_counts)
     )
-    me_monthly_excl: dict[str, dict[str, int]] = defaultdict(lambda: {"commits": 0, "insertions": 0, "deletions": 0})
-    me_monthly_boot: dict[str, dict[str, int]] = defaultdict(lambda: {"commits": 0, "insertions": 0, "deletions": 0})
-    me_monthly_tech_excl: dict[str, dict[str, dict[str, int]]] = defaultdict(
-        lambda: defaultdict(lambda: {"commits": 0, "insertions": 0, "deletions": 0})
+    me_monthly_tech_boot: defaultdict[str, defaultdict[str, dict[str, int]]] = dataclasses.field(
+        default_factory=lambda: defaultdict(_tech_commit_counts)
     )
-    me_monthly_tech_boot: dict[str, dict[str, dict[str, int]]] = defaultdict(
-        lambda: defaultdict(lambda: {"commits": 0, "insertions": 0, "deletions": 0})
+    excluded: dict[str, int] = dataclasses.field(
+        default_factory=lambda: {
+            "excluded_files": 0,
+            "excluded_insertions": 0,
+            "excluded_deletions": 0,
+            "excluded_changed": 0,
+        }
     )
-    excluded: dict[str, int] = {
-        "excluded_files": 0,
-        "excluded_insertions": 0,
-        "excluded_deletions": 0,
-        "excluded_changed": 0,
-    }
-    bootstrap_commits: list[dict[str, object]] = []
-    top_commits_heap: list[tuple[int, str, str, dict[str, object]]] = []
-    heapify(top_commits_heap)
-    errors: list[str] = []
-
-    current_sha = ""
-    current_author_name = ""
-    current_author_email = ""
-    current_author_is_me = False
-    current_commit_iso = ""
-    current_subject = ""
-    current_insertions = 0
-    current_deletions = 0
-    current_files_touched = 0
-    current_langs: dict[str, tuple[int, int]] = defaultdict(lambda: (0, 0))
-    current_dirs: dict[str, tuple[int, int]] = defaultdict(lambda: (0, 0))
-    current_excluded_files = 0
-    current_excluded_insertions = 0
-    current_excluded_deletions = 0
-    current_excluded_changed = 0
-
-    def apply_commit() -> None:
-        nonlocal current_sha, current_author_name, current_author_email, current_author_is_me
-        nonlocal current_commit_iso, current_subject, current_insertions, current_deletions, current_files_touched
-        nonlocal current_langs, current_dirs
-        nonlocal current_excluded_files, current_excluded_insertions, current_excluded_deletions, current_excluded_changed
-
-        if not current_sha:
-            return
-
-        excluded_commits = exclude_commits or set()
-        if current_sha in excluded_commits:
-            current_sha = ""
-            current_author_name = ""
-            current_author_email = ""
-            current_author_is_me = False
-            current_commit_iso = ""
-            current_subject = ""
-            current_insertions = 0
-            current_deletions = 0
-            current_files_touched = 0
-            current_langs = defaultdict(lambda: (0, 0))
-            current_dirs = defaultdict(lambda: (0, 0))
-            current_excluded_files = 0
-            current_excluded_insertions = 0
-            current_excluded_deletions = 0
-            current_excluded_changed = 0
-            return
-
-        excluded["excluded_files"] += current_excluded_files
-        excluded["excluded_insertions"] += current_excluded_insertions
-        excluded["excluded_deletions"] += current_excluded_deletions
-        excluded["excluded_changed"] += current_excluded_changed
-
-        bootstrap_shas_excluded = bootstrap_exclude_shas or set()
-        is_boot = bootstrap.is_bootstrap(current_insertions, current_deletions, current_files_touched) and current_sha not in bootstrap_shas_excluded
-        stats_target = stats_boot if is_boot else stats_excl
-        weekly_target = weekly_boot if is_boot else weekly_excl
-        weekly_tech_target = weekly_tech_boot if is_boot else weekly_tech_excl
-        me_weekly_target = me_weekly_boot if is_boot else me_weekly_excl
-        me_weekly_tech_target = me_weekly_tech_boot if is_boot else me_weekly_tech_excl
-        authors_target = authors_boot if is_boot else authors_excl
-        langs_target = languages_boot if is_boot else languages_excl
-        dirs_target = dirs_boot if is_boot else dirs_excl
+    bootstrap_commits: list[dict[str, object]] = dataclasses.field(default_factory=list)
+    top_commits_heap: list[tuple[int, str, str, dict[str, object]]] = dataclasses.field(default_factory=list)
+
+    def add_commit(
+        self,
+        *,
+        is_boot: bool,
+        author_name: str,
+        author_email: str,
+        author_is_me: bool,
+        commit_iso: str,
+        insertions: int,
+        deletions: int,
+        langs: dict[str, list[int]],
+        dirs: dict[str, list[int]],
+        excluded_files: int,
+        excluded_insertions: int,
+        excluded_deletions: int,
+        commit_row: dict[str, object],
+    ) -> None:
+        excluded = self.excluded
+        excluded["excluded_files"] += excluded_files
+        excluded["excluded_insertions"] += excluded_insertions
+        excluded["excluded_deletions"] += excluded_deletions
+        excluded["excluded_changed"] += excluded_insertions + excluded_deletions
+
+        stats_target = self.stats_boot if is_boot else self.stats_excl
+        weekly_target = self.weekly_boot if is_boot else self.weekly_excl
+        weekly_tech_target = self.weekly_tech_boot if is_boot else self.weekly_tech_excl
+        me_weekly_target = self.me_weekly_boot if is_boot else self.me_weekly_excl
+        me_weekly_tech_target = self.me_weekly_tech_boot if is_boot else self.me_weekly_tech_excl
+        authors_target = self.authors_boot if is_boot else self.authors_excl
+        langs_target = self.languages_boot if is_boot else self.languages_excl
+        dirs_target = self.dirs_boot if is_boot else self.dirs_excl
 
         stats_target.commits_total += 1
-        stats_target.insertions_total += current_insertions
-        stats_target.deletions_total += current_deletions
+        stats_target.insertions_total += insertions
+        stats_target.deletions_total += deletions
 
-        wk = _week_start_iso(current_commit_iso)
+        wk = _week_start_iso(commit_iso)
         if wk:
             weekly_target[wk]["commits"] += 1
-            weekly_target[wk]["insertions"] += current_insertions
-            weekly_target[wk]["deletions"] += current_deletions
-            for tech, (ins, dele) in current_langs.items():
+            weekly_target[wk]["insertions"] += insertions
+            weekly_target[wk]["deletions"] += deletions
+            for tech, (ins, dele) in langs.items():
                 if (ins + dele) <= 0:
                     continue
                 weekly_tech_target[wk][tech]["commits"] += 1
                 weekly_tech_target[wk][tech]["insertions"] += ins
                 weekly_tech_target[wk][tech]["deletions"] += dele
-            if current_author_is_me:
+            if author_is_me:
                 me_weekly_target[wk]["commits"] += 1
-                me_weekly_target[wk]["insertions"] += current_insertions
-                me_weekly_target[wk]["deletions"] += current_deletions
-                for tech, (ins, dele) in current_langs.items():
+                me_weekly_target[wk]["insertions"] += insertions
+                me_weekly_target[wk]["deletions"] += deletions
+                for tech, (ins, dele) in langs.items():
                     if (ins + dele) <= 0:
                         continue
                     me_weekly_tech_target[wk][tech]["commits"] += 1
                     me_weekly_tech_target[wk][tech]["insertions"] += ins
                     me_weekly_tech_target[wk][tech]["deletions"] += dele
-        if current_author_is_me:
+        if author_is_me:
             stats_target.commits_me += 1
-            stats_target.insertions_me += current_insertions
-            stats_target.deletions_me += current_deletions
+            stats_target.insertions_me += insertions
+            stats_target.deletions_me += deletions
 
-        email_key = normalize_email(current_author_email) if current_author_email else ""
+        email_key = normalize_email(author_email) if author_email else ""
         if email_key:
             author = authors_target.get(email_key)
             if author is None:
-                author = AuthorStats(name=current_author_name, email=current_author_email)
-                authors_target[email_key] = author
-            author.commits += 1
-            author.insertions += current_insertions
-            author.deletions += current_deletions
-
-        for lang, (ins, dele) in current_langs.items():
-            langs_target[lang]["insertions"] += ins
-            langs_target[lang]["deletions"] += dele
-            if current_author_is_me:
-                langs_target[lang]["insertions_me"] += ins
-                langs_target[lang]["deletions_me"] += dele
-
-        for d, (ins, dele) in current_dirs.items():
-            dirs_target[d]["insertions"] += ins
-            dirs_target[d]["deletions"] += dele
-            if current_author_is_me:
-                dirs_target[d]["insertions_me"] += ins
-                dirs_target[d]["deletions_me"] += dele
-
-        month_key = current_commit_iso[:7] if len(current_commit_iso) >= 7 and current_commit_iso[4:5] == "-" else ""
-        if current_author_is_me and month_key:
-            m_target = me_monthly_boot if is_boot else me_monthly_excl
+                authors_target[email_key] = AuthorStats(
+                    name=author_name, email=author_email, commits=1, insertions=insertions, deletions=deletions
+                )
+            else:
+                author.commits += 1
+                author.insertions += insertions
+                author.deletions += deletions
+
+        for lang, (ins, dele) in langs.items():
+            row = langs_target[lang]
+            row[0] += ins
+            row[1] += dele
+            if author_is_me:
+                row[2] += ins
+                row[3] += dele
+
+        for d, (ins, dele) in dirs.items():
+            row = dirs_target[d]
+            row[0] += ins
+            row[1] += dele
+            if author_is_me:
+                row[2] += ins
+                row[3] += dele
+
+        month_key = commit_iso[:7] if len(commit_iso) >= 7 and commit_iso[4:5] == "-" else ""
+        if author_is_me and month_key:
+            m_target = self.me_monthly_boot if is_boot else self.me_monthly_excl
             m_target[month_key]["commits"] += 1
-            m_target[month_key]["insertions"] += current_insertions
-            m_target[month_key]["deletions"] += current_deletions
+            m_target[month_key]["insertions"] += insertions
+            m_target[month_key]["deletions"] += deletions
 
-            tech_target = me_monthly_tech_boot if is_boot else me_monthly_tech_excl
-            for tech, (ins, dele) in current_langs.items():
+            tech_target = self.me_monthly_tech_boot if is_boot else self.me_monthly_tech_excl
+            for tech, (ins, dele) in langs.items():
                 tech_target[month_key][tech]["commits"] += 1
                 tech_target[month_key][tech]["insertions"] += ins
                 tech_target[month_key][tech]["deletions"] += dele
 
         if is_boot:
-            bootstrap_commits.append(
-                {
-                    "sha": current_sha,
-                    "commit_iso": current_commit_iso,
-                    "author_name": current_author_name,
-                    "author_email": current_author_email,
-                    "is_me": bool(current_author_is_me),
-                    "subject": current_subject,
-                    "files_touched": int(current_files_touched),
-                    "insertions": int(current_insertions),
-                    "deletions": int(current_deletions),
-                    "changed": int(current_insertions + current_deletions),
-                }
-            )
+            self.bootstrap_commits.append({k: v for k, v in commit_row.items() if k != "is_bootstrap"})
 
-        commit_row: dict[str, object] = {
-            "sha": current_sha,
-            "commit_iso": current_commit_iso,
-            "author_name": current_author_name,
-            "author_email": current_author_email,
-            "is_me": bool(current_author_is_me),
-            "is_bootstrap": bool(is_boot),
-            "subject": current_subject,
-            "files_touched": int(current_files_touched),
-            "insertions": int(current_insertions),
-            "deletions": int(current_deletions),
-            "changed": int(current_insertions + current_deletions),
-        }
         entry = (
             int(commit_row.get("changed", 0)),
             str(commit_row.get("sha", "")),
             str(commit_row.get("commit_iso", "")),
             commit_row,
         )
-        if len(top_commits_heap) < 50:
-            heappush(top_commits_heap, entry)
+        heap = self.top_commits_heap
+        if len(heap) < 50:
+            heappush(heap, entry)
         else:
-            if entry > top_commits_heap[0]:
-                heapreplace(top_commits_heap, entry)
-
-        current_sha = ""
-        current_author_name = ""
-        current_author_email = ""
-        current_author_is_me = False
-        current_commit_iso = ""
-        current_subject = ""
-        current_insertions = 0
-        current_deletions = 0
-        current_files_touched = 0
-        current_langs = defaultdict(lambda: (0, 0))
-        current_dirs = defaultdict(lambda: (0, 0))
-        current_excluded_files = 0
-        current_excluded_insertions = 0
-        current_excluded_deletions = 0
-        current_excluded_changed = 0
+            if entry > heap[0]:
+                heapreplace(heap, entry)
 
-    try:
-        proc = subprocess.Popen(
-            cmd,
-            cwd=str(repo),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-    except Exception as e:
+    def result(self) -> PeriodStreamResult:
+        top_commits = [t[-1] for t in self.top_commits_heap]
+        top_commits.sort(key=lambda d: (-int(d.get("changed", 0)), str(d.get("sha", ""))))
         return (
-            stats_excl,
-            stats_boot,
-            dict(weekly_excl),
-            dict(weekly_boot),
-            {wk: dict(techs) for wk, techs in weekly_tech_excl.items()},
-            {wk: dict(techs) for wk, techs in weekly_tech_boot.items()},
-            dict(me_weekly_excl),
-            dict(me_weekly_boot),
-            {wk: dict(techs) for wk, techs in me_weekly_tech_excl.items()},
-            {wk: dict(techs) for wk, techs in me_weekly_tech_boot.items()},
-            authors_excl,
-            authors_boot,
-            dict(languages_excl),
-            dict(languages_boot),
-            dict(dirs_excl),
-            dict(dirs_boot),
-            dict(me_monthly_excl),
-            dict(me_monthly_boot),
-            {m: dict(v) for m, v in me_monthly_tech_excl.items()},
-            {m: dict(v) for m, v in me_monthly_tech_boot.items()},
-            dict(excluded),
-            bootstrap_commits,
-            [],
-            [f"failed to start git log: {e}"],
+            self.stats_excl,
+            self.stats_boot,
+            dict(self.weekly_excl),
+            dict(self.weekly_boot),
+            {wk: dict(techs) for wk, techs in self.weekly_tech_excl.items()},
+            {wk: dict(techs) for wk, techs in self.weekly_tech_boot.items()},
+            dict(self.me_weekly_excl),
+            dict(self.me_weekly_boot),
+            {wk: dict(techs) for wk, techs in self.me_weekly_tech_excl.items()},
+            {wk: dict(techs) for wk, techs in self.me_weekly_tech_boot.items()},
+            self.authors_excl,
+            self.authors_boot,
+            _change_dicts(self.languages_excl),
+            _change_dicts(self.languages_boot),
+            _change_dicts(self.dirs_excl),
+            _change_dicts(self.dirs_boot),
+            dict(self.me_monthly_excl),
+            dict(self.me_monthly_boot),
+            {m: dict(v) for m, v in self.me_monthly_tech_excl.items()},
+            {m: dict(v) for m, v in self.me_monthly_tech_boot.items()},
+            dict(self.excluded),
+            self.bootstrap_commits,
+            top_commits,
         )
 
-    stderr_chunks: list[str] = []
+
+def parse_numstat_stream_multi(
+    repo: Path,
+    periods: list[Period],
+    include_merges: bool,
+    me: MeMatcher,
+    bootstrap: BootstrapConfig,
+    exclude_path_prefixes: list[str],
+    exclude_path_globs: list[str],
+    bootstrap_exclude_shas: set[str] | None = None,
+    exclude_commits: set[str] | None = None,
+    last_commit_ts: int | None = None,
+) -> tuple[list[PeriodStreamResult], list[str]]:
+    """
+    Run one `git log --numstat` over the union of `periods` and bucket each commit by committer time.
+
+    Returns one result per period (in the given order) plus the errors for the whole stream.
+    Periods may overlap; a commit is counted in every period whose window contains it.
+    Periods starting after `last_commit_ts` (the repo's newest committer time, when known) stay empty and are
+    left out of the walk; if none remain, git is not run at all.
+    """
+    accs = [_PeriodAccumulator(*_period_bounds_ts(p)) for p in periods]
+    errors: list[str] = []
+    walked = [
+        (p, acc) for p, acc in zip(periods, accs) if last_commit_ts is None or acc.start_ts <= last_commit_ts
+    ]
+    if not walked:
+        return [acc.result() for acc in accs], errors
+    walk_accs = [acc for _, acc in walked]
+
+    start = f"{min(p.start for p, _ in walked).isoformat()}T00:00:00Z"
+    end = f"{max(p.end for p, _ in walked).isoformat()}T00:00:00Z"
+
+    # %ct goes last so the historical header layout is unchanged; the subject may contain tabs, so split from the right.
+    pretty = "@@@%H\t%an\t%ae\t%aI\t%s\t%ct"
+    cmd = [
+        "git",
+        "log",
+        "--all",
+        f"--since={start}",
+        f"--before={end}",
+        "--date=iso-strict",
+        f"--pretty=format:{pretty}",
+        "--numstat",
+        "-z",
+    ]
+    if not include_merges:
+        cmd.insert(2, "--no-merges")
+
+    excluded_commits = exclude_commits or set()
+    bootstrap_shas_excluded = bootstrap_exclude_shas or set()
+
+    current_sha = ""
+    current_targets: list[_PeriodAccumulator] = []
+    current_author_name = ""
+    current_author_email = ""
+    current_author_is_me = False
+    current_commit_iso = ""
+    current_subject = ""
+    current_insertions = 0
+    current_deletions = 0
+    current_files_touched = 0
+    # Per-commit [insertions, deletions] pairs, updated in place so a numstat row allocates nothing new.
+    current_langs: dict[str, list[int]] = {}
+    current_dirs: dict[str, list[int]] = {}
+    current_excluded_files = 0
+    current_excluded_insertions = 0
+    current_excluded_deletions = 0
+
+    def apply_commit() -> None:
+        nonlocal current_sha, current_targets, current_insertions, current_deletions, current_files_touched
+        nonlocal current_excluded_files, current_excluded_insertions, current_excluded_deletions
+
+        if current_sha and current_targets and current_sha not in excluded_commits:
+            is_boot = (
+                bootstrap.is_bootstrap(current_insertions, current_deletions, current_files_touched)
+                and current_sha not in bootstrap_shas_excluded
+            )
+            commit_row: dict[str, object] = {
+                "sha": current_sha,
+                "commit_iso": current_commit_iso,
+                "author_name": current_author_name,
+                "author_email": current_author_email,
+                "is_me": bool(current_author_is_me),
+                "is_bootstrap": bool(is_boot),
+                "subject": current_subject,
+                "files_touched": int(current_files_touched),
+                "insertions": int(current_insertions),
+                "deletions": int(current_deletions),
+                "changed": int(current_insertions + current_deletions),
+            }
+            for acc in current_targets:
+                acc.add_commit(
+                    is_boot=is_boot,
+                    author_name=current_author_name,
+                    author_email=current_author_email,
+                    author_is_me=current_author_is_me,
+                    commit_iso=current_commit_iso,
+                    insertions=current_insertions,
+                    deletions=current_deletions,
+                    langs=current_langs,
+                    dirs=current_dirs,
+                    excluded_files=current_excluded_files,
+                    excluded_insertions=current_excluded_insertions,
+                    excluded_deletions=current_excluded_deletions,
+                    commit_row=commit_row,
+                )
+
+        # The header that follows overwrites the commit identity fields; only the running totals need resetting.
+        # The pair dicts are cleared, not replaced, so their tables stay allocated across commits.
+        current_sha, current_targets = "", []
+        current_insertions = current_deletions = current_files_touched = 0
+        current_excluded_files = current_excluded_insertions = current_excluded_deletions = 0
+        current_langs.clear()
+        current_dirs.clear()
+
+    try:
+        proc = _popen_git_log(cmd, repo)
+    except Exception as e:
+        return [acc.result() for acc in accs], [f"failed to start git log: {e}"]
+
+    stderr_chunks: list[bytes] = []
     stderr_chars = 0
     max_stderr_chars = 50_000
 
@@ -376,51 +467,91 @@ def parse_numstat_stream(
         stderr_thread.start()
 
     assert proc.stdout is not None
-    for raw_line in proc.stdout:
-        line = raw_line.rstrip("\n")
-        if not line:
-            continue
-        if line.startswith("@@@"):
-            apply_commit()
-            parts = line[3:].split("\t", 4)
-            current_sha = parts[0] if len(parts) > 0 else ""
-            current_author_name = parts[1] if len(parts) > 1 else ""
-            current_author_email = parts[2] if len(parts) > 2 else ""
-            current_commit_iso = parts[3] if len(parts) > 3 else ""
-            current_subject = parts[4] if len(parts) > 4 else ""
-            current_author_is_me = me.matches(current_author_name, current_author_email)
-            continue
-
-        parts = line.split("\t", 2)
-        if len(parts) < 2:
-            continue
-        added_s, deleted_s = parts[0], parts[1]
-        file_path = normalize_numstat_path(parts[2]) if len(parts) >= 3 else ""
-        if added_s == "-" or deleted_s == "-":
-            added = 0
-            deleted = 0
+    # With -z, paths arrive verbatim (no quoting, no "{old => new}" rename syntax) and records end in NUL.
+    # Each commit header is glued to its first numstat record by a newline.
+    row_match = _NUMSTAT_ROW.fullmatch
+    is_excluded = build_exclude_matcher(tuple(exclude_path_prefixes), tuple(exclude_path_globs))
+    # A repo's history repeats a handful of authors; match each (name, email) pair against `me` once.
+    is_me_by_author: dict[tuple[str, str], bool] = {}
+    rename_records_left = 0
+    rename_added = 0
+    rename_deleted = 0
+    for record in _iter_nul_records(proc.stdout):
+        if rename_records_left:
+            rename_records_left -= 1
+            if rename_records_left:
+                continue  # pre-rename path
+            added = rename_added
+            deleted = rename_deleted
+            file_path = record.decode("utf-8", "replace")
         else:
-            try:
-                added = int(added_s)
-                deleted = int(deleted_s)
-            except ValueError:
+            if not record:
+                continue
+            if record.startswith(b"@@@"):
+                apply_commit()
+                header, _, record = record.partition(b"\n")
+                parts = header[3:].decode("utf-8", "replace").split("\t", 4)
+                current_sha = parts[0] if len(parts) > 0 else ""
+                # Authors repeat across thousands of commits; intern so every commit row shares one string object.
+                current_author_name = sys.intern(parts[1]) if len(parts) > 1 else ""
+                current_author_email = sys.intern(parts[2]) if len(parts) > 2 else ""
+                current_commit_iso = parts[3] if len(parts) > 3 else ""
+                current_subject = parts[4] if len(parts) > 4 else ""
+                subject, sep, ts = current_subject.rpartition("\t")
+                if sep and ts.lstrip("-").isdigit():
+                    current_subject = subject
+                    commit_ts = int(ts)
+                    current_targets = [acc for acc in walk_accs if acc.start_ts <= commit_ts <= acc.end_ts]
+                elif len(walk_accs) == 1:
+                    # No committer timestamp: git's own --since/--before window is the only period.
+                    current_targets = walk_accs
+                author = (current_author_name, current_author_email)
+                is_me = is_me_by_author.get(author)
+                if is_me is None:
+                    is_me = is_me_by_author[author] = me.matches(*author)
+                current_author_is_me = is_me
+                if not record:
+                    continue
+
+            m = row_match(record)
+            if m is None:
+                continue
+            added_b, deleted_b, path_b = m.groups()
+            if added_b == b"-" or deleted_b == b"-":
+                added = 0
+                deleted = 0
+            else:
+                added = int(added_b)
+                deleted = int(deleted_b)
+            if not path_b:
+                rename_records_left = 2
+                rename_added = added
+                rename_deleted = deleted
                 continue
+            file_path = path_b.decode("utf-8", "replace")
 
-        if file_path and should_exclude_path(file_path, exclude_path_prefixes, exclude_path_globs):
+        if file_path and is_excluded(file_path):
             current_excluded_files += 1
             current_excluded_insertions += added
             current_excluded_deletions += deleted
-            current_excluded_changed += added + deleted
             continue
 
         if file_path:
             lang = language_for_path(file_path)
-            ins0, del0 = current_langs[lang]
-            current_langs[lang] = (ins0 + added, del0 + deleted)
+            pair = current_langs.get(lang)
+            if pair is None:
+                current_langs[lang] = [added, deleted]
+            else:
+                pair[0] += added
+                pair[1] += deleted
 
             dk = dir_key_for_path(file_path, depth=1)
-            ins1, del1 = current_dirs[dk]
-            current_dirs[dk] = (ins1 + added, del1 + deleted)
+            pair = current_dirs.get(dk)
+            if pair is None:
+                current_dirs[dk] = [added, deleted]
+            else:
+                pair[0] += added
+                pair[1] += deleted
 
         current_insertions += added
         current_deletions += deleted
@@ -429,41 +560,64 @@ def parse_numstat_stream(
     code = proc.wait()
     if stderr_thread is not None:
         stderr_thread.join()
-    stderr = "".join(stderr_chunks)
+    stderr = b"".join(stderr_chunks).decode("utf-8", "replace")
     if code != 0:
         errors.append(f"git log exited {code}: {stderr.strip()[:500]}")
 
     apply_commit()
 
-    top_commits = [t[-1] for t in top_commits_heap]
-    top_commits.sort(key=lambda d: (-int(d.get("changed", 0)), str(d.get("sha", ""))))
-
-    return (
-        stats_excl,
-        stats_boot,
-        dict(weekly_excl),
-        dict(weekly_boot),
-        {wk: dict(techs) for wk, techs in weekly_tech_excl.items()},
-        {wk: dict(techs) for wk, techs in weekly_tech_boot.items()},
-        dict(me_weekly_excl),
-        dict(me_weekly_boot),
-        {wk: dict(techs) for wk, techs in me_weekly_tech_excl.items()},
-        {wk: dict(techs) for wk, techs in me_weekly_tech_boot.items()},
-        authors_excl,
-        authors_boot,
-        dict(languages_excl),
-        dict(languages_boot),
-        dict(dirs_excl),
-        dict(dirs_boot),
-        dict(me_monthly_excl),
-        dict(me_monthly_boot),
-        {m: dict(v) for m, v in me_monthly_tech_excl.items()},
-        {m: dict(v) for m, v in me_monthly_tech_boot.items()},
-        dict(excluded),
-        bootstrap_commits,
-        top_commits,
-        errors,
+    return [acc.result() for acc in accs], errors
+
+
+def parse_numstat_stream(
+    repo: Path,
+    period: Period,
+    include_merges: bool,
+    me: MeMatcher,
+    bootstrap: BootstrapConfig,
+    exclude_path_prefixes: list[str],
+    exclude_path_globs: list[str],
+    bootstrap_exclude_shas: set[str] | None = None,
+    exclude_commits: set[str] | None = None,
+) -> tuple[
+    RepoYearStats,
+    RepoYearStats,
+    dict[str, dict[str, int]],
+    dict[str, dict[str, int]],
+    dict[str, dict[str, dict[str, int]]],
+    dict[str, dict[str, dict[str, int]]],
+    dict[str, dict[str, int]],
+    dict[str, dict[str, int]],
+    dict[str, dict[str, dict[str, int]]],
+    dict[str, dict[str, dict[str, int]]],
+    dict[str, AuthorStats],
+    dict[str, AuthorStats],
+    dict[str, dict[str, int]],
+    dict[str, dict[str, int]],
+    dict[str, dict[str, int]],
+    dict[str, dict[str, int]],
+    dict[str, dict[str, int]],
+    dict[str, dict[str, int]],
+    dict[str, dict[str, dict[str, int]]],
+    dict[str, dict[str, dict[str, int]]],
+    dict[str, int],
+    list[dict[str, object]],
+    list[dict[str, object]],
+    list[str],  # errors
+]:
+    """Single-period form of parse_numstat_stream_multi: the PeriodStreamResult fields followed by errors."""
+    (result,), errors = parse_numstat_stream_multi(
+        repo=repo,
+        periods=[period],
+        include_merges=include_merges,
+        me=me,
+        bootstrap=bootstrap,
+        exclude_path_prefixes=exclude_path_prefixes,
+        exclude_path_globs=exclude_path_globs,
+        bootstrap_exclude_shas=bootstrap_exclude_shas,
+        exclude_commits=exclude_commits,
     )
+    return (*result, errors)
 
 
 def analyze_repo(
@@ -485,7 +639,7 @@ def analyze_repo(
     errors: list[str] = []
 
     first_iso, first_name, first_email = get_first_commit(repo)
-    last_iso, _ = get_last_commit(repo)
+    last_iso, last_ts = get_last_commit(repo)
 
     period_stats_excl: dict[str, RepoYearStats] = {}
     period_stats_boot: dict[str, RepoYearStats] = {}
@@ -511,7 +665,22 @@ def analyze_repo(
     bootstrap_commits_by_period: dict[str, list[dict[str, object]]] = {}
     top_commits_by_period: dict[str, list[dict[str, object]]] = {}
 
-    for period in periods:
+    # One git log walk covers every period; commits are bucketed by committer time while streaming.
+    parsed, errs = parse_numstat_stream_multi(
+        repo=repo,
+        periods=periods,
+        include_merges=include_merges,
+        me=me,
+        bootstrap=bootstrap,
+        exclude_path_prefixes=exclude_path_prefixes,
+        exclude_path_globs=exclude_path_globs,
+        bootstrap_exclude_shas=bootstrap_exclude_shas,
+        exclude_commits=exclude_commits,
+        last_commit_ts=last_ts,
+    )
+    errors.extend(errs)
+
+    for period, parsed_period in zip(periods, parsed):
         (
             stats_excl_boot,
             stats_boot_only,
@@ -536,18 +705,7 @@ def analyze_repo(
             excluded,
             boot_commits,
             top_commits,
-            errs,
-        ) = parse_numstat_stream(
-            repo=repo,
-            period=period,
-            include_merges=include_merges,
-            me=me,
-            bootstrap=bootstrap,
-            exclude_path_prefixes=exclude_path_prefixes,
-            exclude_path_globs=exclude_path_globs,
-            bootstrap_exclude_shas=bootstrap_exclude_shas,
-            exclude_commits=exclude_commits,
-        )
+        ) = parsed_period
         period_stats_excl[period.label] = stats_excl_boot
         period_stats_boot[period.label] = stats_boot_only
         weekly_by_period_excl[period.label] = weekly_excl_boot
@@ -571,7 +729,6 @@ def analyze_repo(
         excluded_by_period[period.label] = excluded
         bootstrap_commits_by_period[period.label] = boot_commits
         top_commits_by_period[period.label] = top_commits
-        errors.extend(errs)
 
     return RepoResult(
         key=key,
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 import datetime as dt
+from collections.abc import Callable
 from pathlib import Path
 
 from .analysis_aggregate import (
-    aggregate_authors,
+    aggregate_authors_variants,
     aggregate_dirs,
+    aggregate_dirs_variants,
     aggregate_excluded,
     aggregate_languages,
+    aggregate_languages_variants,
     aggregate_me_monthly,
     aggregate_me_monthly_tech,
     aggregate_period,
+    aggregate_period_variants,
     aggregate_weekly,
     aggregate_weekly_tech,
 )
@@ -18,6 +22,7 @@ from .analysis_periods import Period, month_labels_for_period
 from .analysis_render import render_comparison_txt_from_md, render_year_in_review, render_yoy_year_in_review, write_comparison_md
 from .analysis_write import (
     ensure_dir,
+    run_writers,
     write_authors_csv,
     write_bootstrap_commits_csv,
     write_dirs_csv,
@@ -33,6 +38,13 @@ from .identity import MeMatcher
 from .models import AuthorStats, BootstrapConfig, RepoResult
 
 
+def write_selection_reports(*, report_dir: Path, selection_rows: list[dict[str, str]]) -> None:
+    debug_dir = report_dir / "debug"
+    ensure_dir(debug_dir)
+    write_repo_selection_csv(debug_dir / "repo_selection.csv", selection_rows)
+    write_repo_selection_summary(debug_dir / "repo_selection_summary.json", selection_rows)
+
+
 def write_reports(
     *,
     report_dir: Path,
@@ -40,7 +52,7 @@ def write_reports(
     run_type: str,
     periods: list[Period],
     results: list[RepoResult],
-    selection_rows: list[dict[str, str]],
+    selection_rows: list[dict[str, str]] | None,
     repo_count_candidates: int,
     dedupe: str,
     max_repos: int,
@@ -72,6 +84,9 @@ def write_reports(
     ensure_dir(debug_dir)
     ensure_dir(markup_dir)
 
+    # Per-period CSV and JSON outputs only read the aggregates below; queue them and write them concurrently at the end.
+    write_jobs: list[tuple[Callable[..., None], tuple[object, ...]]] = []
+
     def review_prefix_for_label(label: str) -> str:
         s = str(label or "").strip()
         return "year_in_review" if s.isdigit() and len(s) == 4 else "period_in_review"
@@ -89,8 +104,9 @@ def write_reports(
             )
             md_path.write_text(f"```text\n{text.rstrip()}\n```\n", encoding="utf-8")
 
-    write_repo_selection_csv(debug_dir / "repo_selection.csv", selection_rows)
-    write_repo_selection_summary(debug_dir / "repo_selection_summary.json", selection_rows)
+    # None means the caller already wrote the selection debug files (e.g. while analysis was running).
+    if selection_rows is not None:
+        write_selection_reports(report_dir=report_dir, selection_rows=selection_rows)
 
     period_aggs_excl: dict[str, dict] = {}
     period_aggs_boot: dict[str, dict] = {}
@@ -108,21 +124,11 @@ def write_reports(
 
     for period in periods:
         label = period.label
-        agg_excl = aggregate_period(results, period, me, include_bootstraps=False)
-        agg_boot = aggregate_period(results, period, me, include_bootstraps=False, bootstraps_only=True)
-        agg_incl = aggregate_period(results, period, me, include_bootstraps=True)
-
-        authors_excl = aggregate_authors(results, label, include_bootstraps=False)
-        authors_boot = aggregate_authors(results, label, include_bootstraps=False, bootstraps_only=True)
-        authors_incl = aggregate_authors(results, label, include_bootstraps=True)
-
-        languages_excl = aggregate_languages(results, label, include_bootstraps=False)
-        languages_boot = aggregate_languages(results, label, include_bootstraps=False, bootstraps_only=True)
-        languages_incl = aggregate_languages(results, label, include_bootstraps=True)
-
-        dirs_excl = aggregate_dirs(results, label, include_bootstraps=False)
-        dirs_boot = aggregate_dirs(results, label, include_bootstraps=False, bootstraps_only=True)
-        dirs_incl = aggregate_dirs(results, label, include_bootstraps=True)
+        # Each call walks `results` once and yields the (excl, bootstraps-only, incl) variants together.
+        agg_excl, agg_boot, agg_incl = aggregate_period_variants(results, period, me)
+        authors_excl, authors_boot, authors_incl = aggregate_authors_variants(results, label)
+        languages_excl, languages_boot, languages_incl = aggregate_languages_variants(results, label)
+        dirs_excl, dirs_boot, dirs_incl = aggregate_dirs_variants(results, label)
 
         period_aggs_excl[label] = agg_excl
         period_aggs_boot[label] = agg_boot
@@ -199,13 +205,17 @@ def write_reports(
         if label.isdigit() and len(label) == 4:
             summary["year"] = int(label)
 
-        write_json(json_dir / f"year_{label}_summary.json", summary)
-        write_json(json_dir / f"year_{label}_excluded.json", excluded_agg)
-        write_repos_csv(csv_dir / f"year_{label}_repos.csv", results, label, me)
-        write_authors_csv(csv_dir / f"year_{label}_authors.csv", authors_agg, me)
-        write_languages_csv(csv_dir / f"year_{label}_languages.csv", languages_agg)
-        write_dirs_csv(csv_dir / f"year_{label}_dirs.csv", dirs_agg)
-        write_bootstrap_commits_csv(csv_dir / f"year_{label}_bootstraps_commits.csv", results, label)
+        write_jobs.extend(
+            [
+                (write_json, (json_dir / f"year_{label}_summary.json", summary)),
+                (write_json, (json_dir / f"year_{label}_excluded.json", excluded_agg)),
+                (write_repos_csv, (csv_dir / f"year_{label}_repos.csv", results, label, me)),
+                (write_authors_csv, (csv_dir / f"year_{label}_authors.csv", authors_agg, me)),
+                (write_languages_csv, (csv_dir / f"year_{label}_languages.csv", languages_agg)),
+                (write_dirs_csv, (csv_dir / f"year_{label}_dirs.csv", dirs_agg)),
+                (write_bootstrap_commits_csv, (csv_dir / f"year_{label}_bootstraps_commits.csv", results, label)),
+            ]
+        )
         bootstrap_rows: list[dict[str, object]] = []
         for r in results:
             for c in r.bootstrap_commits_by_period.get(label, []):
@@ -215,21 +225,23 @@ def write_reports(
                 row["remote_canonical"] = r.remote_canonical
                 bootstrap_rows.append(row)
         bootstrap_rows.sort(key=lambda d: (-int(d.get("changed", 0)), str(d.get("repo_key", "")), str(d.get("sha", ""))))
-        write_json(
-            debug_dir / f"bootstraps_commits_{label}.json",
-            {
-                "period": label,
-                "bootstrap_config": {
-                    "changed_threshold": bootstrap_cfg.changed_threshold,
-                    "files_threshold": bootstrap_cfg.files_threshold,
-                    "addition_ratio": bootstrap_cfg.addition_ratio,
-                },
-                "commits": bootstrap_rows,
+        bootstraps_debug = {
+            "period": label,
+            "bootstrap_config": {
+                "changed_threshold": bootstrap_cfg.changed_threshold,
+                "files_threshold": bootstrap_cfg.files_threshold,
+                "addition_ratio": bootstrap_cfg.addition_ratio,
             },
+            "commits": bootstrap_rows,
+        }
+        write_jobs.append((write_json, (debug_dir / f"bootstraps_commits_{label}.json", bootstraps_debug)))
+        write_jobs.extend(
+            [
+                (write_authors_csv, (csv_dir / f"year_{label}_bootstraps_authors.csv", authors_boot, me)),
+                (write_languages_csv, (csv_dir / f"year_{label}_bootstraps_languages.csv", languages_boot)),
+                (write_dirs_csv, (csv_dir / f"year_{label}_bootstraps_dirs.csv", dirs_boot)),
+            ]
         )
-        write_authors_csv(csv_dir / f"year_{label}_bootstraps_authors.csv", authors_boot, me)
-        write_languages_csv(csv_dir / f"year_{label}_bootstraps_languages.csv", languages_boot)
-        write_dirs_csv(csv_dir / f"year_{label}_bootstraps_dirs.csv", dirs_boot)
 
         write_txt_and_markup(
             txt_path=report_dir / f"{review_prefix_for_label(label)}_{label}.txt",
@@ -326,7 +338,7 @@ def write_reports(
                 },
             }
             detailed_periods[label] = detailed_json
-            write_json(timeseries_dir / f"year_{label}_me_timeseries.json", detailed_json)
+            write_jobs.append((write_json, (timeseries_dir / f"year_{label}_me_timeseries.json", detailed_json)))
 
         weekly_excl = aggregate_weekly(results, label, include_bootstraps=False)
         weekly_boot = aggregate_weekly(results, label, include_bootstraps=False, bootstraps_only=True)
@@ -370,30 +382,30 @@ def write_reports(
                 )
             return rows
 
-        write_json(
-            timeseries_dir / f"year_{label}_weekly.json",
-            {
-                "generated_at": generated_at,
-                "period": label,
-                "start": period.start_iso,
-                "end": period.end_iso,
-                "technology_kind": "language_for_path",
-                "definition": {
-                    "bucket": "week_start_monday_00_00_00Z",
-                    "timestamp_source": "author_time_%aI_converted_to_utc",
-                },
-                "series": {
-                    "excl_bootstraps": weekly_rows(weekly_excl, weekly_tech_excl),
-                    "bootstraps": weekly_rows(weekly_boot, weekly_tech_boot),
-                    "including_bootstraps": weekly_rows(weekly_incl, weekly_tech_incl),
-                },
+        weekly_json = {
+            "generated_at": generated_at,
+            "period": label,
+            "start": period.start_iso,
+            "end": period.end_iso,
+            "technology_kind": "language_for_path",
+            "definition": {
+                "bucket": "week_start_monday_00_00_00Z",
+                "timestamp_source": "author_time_%aI_converted_to_utc",
             },
-        )
+            "series": {
+                "excl_bootstraps": weekly_rows(weekly_excl, weekly_tech_excl),
+                "bootstraps": weekly_rows(weekly_boot, weekly_tech_boot),
+                "including_bootstraps": weekly_rows(weekly_incl, weekly_tech_incl),
+            },
+        }
+        write_jobs.append((write_json, (timeseries_dir / f"year_{label}_weekly.json", weekly_json)))
 
-    write_repo_activity_csv(csv_dir / "repo_activity.csv", results, [p.label for p in periods])
-    write_top_commits_csv(csv_dir / "top_commits.csv", results, [p.label for p in periods], limit=50)
+    period_labels = [p.label for p in periods]
+    write_jobs.append((write_repo_activity_csv, (csv_dir / "repo_activity.csv", results, period_labels)))
+    write_jobs.append((write_top_commits_csv, (csv_dir / "top_commits.csv", results, period_labels)))
     if detailed:
-        write_json(timeseries_dir / "me_timeseries.json", {"generated_at": generated_at, "periods": detailed_periods})
+        write_jobs.append((write_json, (timeseries_dir / "me_timeseries.json", {"generated_at": generated_at, "periods": detailed_periods})))
+    run_writers(write_jobs)
 
     # Comparison markdown (if exactly two periods)
     if len(periods) == 2:
@@ -406,7 +418,7 @@ def write_reports(
         d0 = period_dirs_incl[p0.label] if include_bootstraps else period_dirs_excl[p0.label]
         d1 = period_dirs_incl[p1.label] if include_bootstraps else period_dirs_excl[p1.label]
 
-        write_comparison_md(
+        comp_md = write_comparison_md(
             markup_dir / f"comparison_{p0.label}_vs_{p1.label}.md",
             y0,
             y1,
@@ -416,9 +428,8 @@ def write_reports(
             d1,
             include_bootstraps=include_bootstraps,
         )
-        comp_md_path = markup_dir / f"comparison_{p0.label}_vs_{p1.label}.md"
+        # Render the text twin from the markdown in hand instead of reading the file straight back.
         comp_txt_path = report_dir / f"comparison_{p0.label}_vs_{p1.label}.txt"
-        comp_md = comp_md_path.read_text(encoding="utf-8")
         write_txt_and_markup(txt_path=comp_txt_path, text=render_comparison_txt_from_md(comp_md), write_markup=False)
 
         write_txt_and_markup(
@@ -491,7 +502,7 @@ def write_llm_inflection_stats(
     d1 = aggregate_dirs(results, period_after.label, include_bootstraps=include_bootstraps)
 
     md_path = markup_dir / "llm_inflection_stats.md"
-    write_comparison_md(
+    md = write_comparison_md(
         md_path,
         y0,
         y1,
@@ -503,4 +514,4 @@ def write_llm_inflection_stats(
     )
 
     txt_path = report_dir / "llm_inflection_stats.txt"
-    txt_path.write_text(render_comparison_txt_from_md(md_path.read_text(encoding="utf-8")), encoding="utf-8")
+    txt_path.write_text(render_comparison_txt_from_md(md), encoding="utf-8")
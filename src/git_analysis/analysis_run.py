@@ -2,21 +2,35 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
+import multiprocessing
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from .analysis_periods import Period, llm_inflection_periods, parse_date_precision_to_date, run_type_from_args, slugify
-from .analysis_reports import write_llm_inflection_stats, write_reports
+from .analysis_reports import write_llm_inflection_stats, write_reports, write_selection_reports
 from .analysis_repo import analyze_repo
-from .analysis_selection import discover_and_select_repos
-from .analysis_write import ensure_dir
+from .analysis_selection import discover_and_select_repos, order_repos_largest_first
+from .analysis_write import ensure_dir, write_text_atomic
 from .config import ensure_config_file, infer_me, load_config
 from .identity import MeMatcher, normalize_email, normalize_github_username, normalize_name
 from .models import BootstrapConfig, RepoResult
 from .publish import PublishInputs, collect_publish_inputs, default_publisher_token_path, publish_with_wizard
 
+__all__ = ["format_startup_header", "run_analysis"]
+
+
+def _analysis_pool(jobs: int) -> Executor:
+    # Parsing git log output is CPU-bound Python, so repos are analyzed in worker processes to use more than one core.
+    # With a single job there is nothing to parallelize and a thread avoids the process start-up and pickling cost.
+    # Workers come from a forkserver where available, so they never fork this process after its threads have started.
+    if jobs > 1:
+        ctx = multiprocessing.get_context("forkserver") if "forkserver" in multiprocessing.get_all_start_methods() else None
+        return ProcessPoolExecutor(max_workers=jobs, mp_context=ctx)
+    return ThreadPoolExecutor(max_workers=1)
+
 
 def format_startup_header(
     *,
@@ -103,20 +117,28 @@ def _print_header(
     )
 
 
+def _publish_block_reasons(args: argparse.Namespace) -> list[str]:
+    # Flags that make results incomparable with other uploads; order matches the CLI help.
+    mask = (bool(args.include_merges), bool(args.include_bootstraps), str(args.dedupe) != "remote")
+    if not any(mask):
+        return []
+    labels = ("--include-merges", "--include-bootstraps", f"--dedupe {args.dedupe}")
+    return [label for blocked, label in zip(mask, labels) if blocked]
+
+
 def run_analysis(*, args: argparse.Namespace, periods: list[Period]) -> int:
-    publish_block_reasons: list[str] = []
-    if bool(args.include_merges):
-        publish_block_reasons.append("--include-merges")
-    if bool(args.include_bootstraps):
-        publish_block_reasons.append("--include-bootstraps")
-    if str(args.dedupe) != "remote":
-        publish_block_reasons.append(f"--dedupe {args.dedupe}")
+    publish_block_reasons = _publish_block_reasons(args)
+
+    # Resolve once up front; every later step (header, config bootstrap, discovery, reports) reuses these.
+    scan_root = args.root.resolve()
+    reports_root = Path("reports").resolve()
+    config_missing = bool(args.config and not args.config.exists())
 
     _print_header(
-        root=args.root.resolve(),
+        root=scan_root,
         periods=periods,
         config_path=Path(args.config),
-        config_missing=bool(args.config and not args.config.exists()),
+        config_missing=config_missing,
         jobs=int(args.jobs),
         dedupe=str(args.dedupe),
         max_repos=int(args.max_repos),
@@ -128,12 +150,12 @@ def run_analysis(*, args: argparse.Namespace, periods: list[Period]) -> int:
         publish_block_reasons=publish_block_reasons,
     )
 
-    if args.config and not args.config.exists():
+    if config_missing:
         candidate_template = args.config.resolve().parent / "config-template.json"
         config = ensure_config_file(
             config_path=args.config,
             template_path=candidate_template if candidate_template.exists() else Path("config-template.json").resolve(),
-            scan_root=args.root.resolve(),
+            scan_root=scan_root,
         )
     else:
         config = load_config(args.config)
@@ -157,17 +179,12 @@ def run_analysis(*, args: argparse.Namespace, periods: list[Period]) -> int:
         me_github_usernames_cfg = [str(config.get("github_username"))]
 
     inferred_emails, inferred_names = infer_me()
-    me_emails = {normalize_email(e) for e in (me_emails_cfg or inferred_emails) if e.strip()}
-    me_names = {normalize_name(n) for n in (me_names_cfg or inferred_names) if n.strip()}
-    me_email_globs = tuple(normalize_email(p) for p in me_email_globs_cfg if str(p).strip())
-    me_name_globs = tuple(normalize_name(p) for p in me_name_globs_cfg if str(p).strip())
-    me_github_usernames = {normalize_github_username(u) for u in me_github_usernames_cfg if str(u).strip()}
     me = MeMatcher(
-        frozenset(me_emails),
-        frozenset(me_names),
-        email_globs=me_email_globs,
-        name_globs=me_name_globs,
-        github_usernames=frozenset(me_github_usernames),
+        frozenset(filter(None, map(normalize_email, me_emails_cfg or inferred_emails))),
+        frozenset(filter(None, map(normalize_name, me_names_cfg or inferred_names))),
+        email_globs=tuple(filter(None, map(normalize_email, me_email_globs_cfg))),
+        name_globs=tuple(filter(None, map(normalize_name, me_name_globs_cfg))),
+        github_usernames=frozenset(filter(None, map(normalize_github_username, me_github_usernames_cfg))),
     )
 
     exclude_dirnames = set(config.get("exclude_dirnames", [])) if config.get("exclude_dirnames") else set()
@@ -206,8 +223,6 @@ def run_analysis(*, args: argparse.Namespace, periods: list[Period]) -> int:
     exclude_commits = {str(s).strip() for s in (config.get("exclude_commits") or []) if str(s).strip()}
     include_bootstraps = bool(args.include_bootstraps)
 
-    scan_root = args.root.resolve()
-    reports_root = Path("reports").resolve()
     ensure_dir(reports_root)
 
     run_type = slugify(run_type_from_args(args, periods))
@@ -216,9 +231,10 @@ def run_analysis(*, args: argparse.Namespace, periods: list[Period]) -> int:
     ensure_dir(report_dir)
 
     try:
-        (reports_root / "latest.txt").write_text(str(report_dir.relative_to(reports_root)) + "\n", encoding="utf-8")
-    except Exception:
-        pass
+        write_text_atomic(reports_root / "latest.txt", str(report_dir.relative_to(reports_root)) + "\n")
+    except OSError as e:
+        # Only a convenience pointer to the newest run; the reports themselves can still be written.
+        print(f"Warning: could not update {reports_root / 'latest.txt'}: {e}")
 
     print(f"Scanning for git repos under: {scan_root} (this can take a while)...")
     candidates, repos_to_analyze, selection_rows = discover_and_select_repos(
@@ -231,6 +247,7 @@ def run_analysis(*, args: argparse.Namespace, periods: list[Period]) -> int:
         fork_remote_names=fork_remote_names,
         excluded_repos=list(config.get("excluded_repos", []) or []),
         dedupe=str(args.dedupe),
+        jobs=int(args.jobs),
     )
 
     if args.max_repos and args.max_repos > 0:
@@ -252,43 +269,58 @@ def run_analysis(*, args: argparse.Namespace, periods: list[Period]) -> int:
         year_labels = sorted(set(int(y) for y in (publish_inputs.upload_years or []) if int(y) > 0))
         upload_periods = [Period(label=str(y), start=dt.date(y, 1, 1), end=dt.date(y + 1, 1, 1)) for y in year_labels]
 
+    upload_cfg = dict((config.get("upload_config") or {}) if isinstance(config.get("upload_config"), dict) else {})
+    llm_coding = upload_cfg.get("llm_coding") if isinstance(upload_cfg.get("llm_coding"), dict) else {}
+    dominant_at = parse_date_precision_to_date(llm_coding.get("dominant_at") if isinstance(llm_coding, dict) else None)
+    inflection_periods: tuple[Period, Period] | None = None
+    if dominant_at is not None:
+        try:
+            inflection_periods = llm_inflection_periods(dominant_at=dominant_at)
+        except Exception:
+            inflection_periods = None
+
+    # Every period is collected in the same per-repo git log walk; each consumer reads only its own labels.
     analysis_periods: list[Period] = list(report_periods)
-    if upload_periods:
-        existing_labels = {p.label for p in analysis_periods}
-        for p in upload_periods:
-            if p.label not in existing_labels:
-                analysis_periods.append(p)
-                existing_labels.add(p.label)
+    existing_labels = {p.label for p in analysis_periods}
+    for p in [*upload_periods, *(inflection_periods or ())]:
+        if p.label not in existing_labels:
+            analysis_periods.append(p)
+            existing_labels.add(p.label)
+
+    dispatch_order = order_repos_largest_first(repos_to_analyze, jobs=int(args.jobs))
+
+    # Bind the run-wide arguments once; submissions only vary the repo (all periods share one log walk).
+    analyze = functools.partial(
+        analyze_repo,
+        include_merges=args.include_merges,
+        me=me,
+        bootstrap=bootstrap_cfg,
+        exclude_path_prefixes=exclude_path_prefixes,
+        exclude_path_globs=exclude_path_globs,
+        bootstrap_exclude_shas=bootstrap_exclude_shas,
+        exclude_commits=exclude_commits,
+    )
 
     results: list[RepoResult] = []
-    with ThreadPoolExecutor(max_workers=args.jobs) as ex:
+    # No more workers than repos: idle workers would only cost a process (or thread) each.
+    with _analysis_pool(min(int(args.jobs), len(dispatch_order)) or 1) as ex:
         futs = []
-        for key, repo, remote_name, remote, remote_canonical, dups in repos_to_analyze:
-            futs.append(
-                ex.submit(
-                    analyze_repo,
-                    repo,
-                    key,
-                    remote_name,
-                    remote,
-                    remote_canonical,
-                    dups,
-                    analysis_periods,
-                    args.include_merges,
-                    me,
-                    bootstrap_cfg,
-                    exclude_path_prefixes,
-                    exclude_path_globs,
-                    bootstrap_exclude_shas,
-                    exclude_commits,
-                )
-            )
-
-        for i, fut in enumerate(as_completed(futs), start=1):
-            r = fut.result()
-            results.append(r)
-            if i % 10 == 0 or i == len(futs):
-                print(f"Analyzed {i}/{len(futs)} repos...")
+        for key, repo, remote_name, remote, remote_canonical, dups in dispatch_order:
+            futs.append(ex.submit(analyze, repo, key, remote_name, remote, remote_canonical, dups, analysis_periods))
+
+        # Selection debug output only depends on discovery; write it while the pool is busy.
+        write_selection_reports(report_dir=report_dir, selection_rows=selection_rows)
+
+        try:
+            for i, fut in enumerate(as_completed(futs), start=1):
+                r = fut.result()
+                results.append(r)
+                if i % 10 == 0 or i == len(futs):
+                    print(f"Analyzed {i}/{len(futs)} repos...")
+        except BaseException:
+            # On Ctrl-C or a failed repo, drop the queued repos instead of analyzing them all before exiting.
+            ex.shutdown(wait=False, cancel_futures=True)
+            raise
 
     results.sort(key=lambda r: r.path)
 
@@ -298,7 +330,7 @@ def run_analysis(*, args: argparse.Namespace, periods: list[Period]) -> int:
         run_type=run_type,
         periods=report_periods,
         results=results,
-        selection_rows=selection_rows,
+        selection_rows=None,
         repo_count_candidates=len(candidates),
         dedupe=str(args.dedupe),
         max_repos=int(args.max_repos),
@@ -318,51 +350,17 @@ def run_analysis(*, args: argparse.Namespace, periods: list[Period]) -> int:
         ascii_top_n=10,
     )
 
-    upload_cfg = dict((config.get("upload_config") or {}) if isinstance(config.get("upload_config"), dict) else {})
-    llm_coding = upload_cfg.get("llm_coding") if isinstance(upload_cfg.get("llm_coding"), dict) else {}
-    dominant_at = parse_date_precision_to_date(llm_coding.get("dominant_at") if isinstance(llm_coding, dict) else None)
-    if dominant_at is not None:
-        try:
-            p_before, p_after = llm_inflection_periods(dominant_at=dominant_at)
-        except Exception:
-            p_before = None
-            p_after = None
-        if p_before is not None and p_after is not None:
-            print(f"Computing LLM inflection comparison ({p_before.start_iso}..{p_before.end_iso} vs {p_after.start_iso}..{p_after.end_iso})...")
-            inflection_results: list[RepoResult] = []
-            with ThreadPoolExecutor(max_workers=args.jobs) as ex:
-                futs2 = []
-                for key, repo, remote_name, remote, remote_canonical, dups in repos_to_analyze:
-                    futs2.append(
-                        ex.submit(
-                            analyze_repo,
-                            repo,
-                            key,
-                            remote_name,
-                            remote,
-                            remote_canonical,
-                            dups,
-                            [p_before, p_after],
-                            args.include_merges,
-                            me,
-                            bootstrap_cfg,
-                            exclude_path_prefixes,
-                            exclude_path_globs,
-                            bootstrap_exclude_shas,
-                            exclude_commits,
-                        )
-                    )
-                for fut in as_completed(futs2):
-                    inflection_results.append(fut.result())
-            inflection_results.sort(key=lambda r: r.path)
-            write_llm_inflection_stats(
-                report_dir=report_dir,
-                period_before=p_before,
-                period_after=p_after,
-                results=inflection_results,
-                me=me,
-                include_bootstraps=include_bootstraps,
-            )
+    if inflection_periods is not None:
+        p_before, p_after = inflection_periods
+        print(f"Computing LLM inflection comparison ({p_before.start_iso}..{p_before.end_iso} vs {p_after.start_iso}..{p_after.end_iso})...")
+        write_llm_inflection_stats(
+            report_dir=report_dir,
+            period_before=p_before,
+            period_after=p_after,
+            results=results,
+            me=me,
+            include_bootstraps=include_bootstraps,
+        )
 
     try:
         publish_with_wizard(
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import fnmatch
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .git import (
     canonicalize_remote,
     detect_fork,
     discover_git_roots,
+    get_commit_count,
     get_last_commit,
     get_remote_urls,
     get_repo_toplevel,
@@ -33,6 +35,7 @@ def discover_and_select_repos(
     fork_remote_names: list[str],
     excluded_repos: list[str],
     dedupe: str,
+    jobs: int = 1,
 ) -> tuple[
     list[Path],
     list[tuple[str, Path, str, str, str, list[str]]],
@@ -40,75 +43,98 @@ def discover_and_select_repos(
 ]:
     excluded_pats = [str(p).strip() for p in (excluded_repos or []) if str(p).strip()]
     candidates = discover_git_roots(scan_root, exclude_dirnames)
+    workers = max(1, min(int(jobs), len(candidates)))
 
-    # Canonicalize and dedupe
-    by_key: dict[str, dict] = {}
-    selection_rows: list[dict[str, str]] = []
-    for cand in candidates:
-        top = get_repo_toplevel(cand)
+    def excluded_by_pattern(top: Path) -> bool:
+        if not excluded_pats:
+            return False
+        try:
+            rel = top.resolve().relative_to(scan_root.resolve()).as_posix()
+        except Exception:
+            rel = top.as_posix()
+        full = top.as_posix()
+        return any(fnmatch.fnmatch(rel, pat) or fnmatch.fnmatch(full, pat) for pat in excluded_pats)
+
+    # Each candidate costs a few git spawns, so the git probes run on a thread pool while the selection
+    # itself stays a serial pass in candidate order. Several candidates can resolve to the same toplevel,
+    # so every probe is done once per toplevel.
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        tops = list(ex.map(get_repo_toplevel, candidates))
+        probe_tops = list(dict.fromkeys(t for t in tops if t is not None and not excluded_by_pattern(t)))
+        remotes_by_top = dict(zip(probe_tops, ex.map(get_remote_urls, probe_tops)))
+
+    # Only skipped rows report the remotes; build each toplevel's summary once, on first use.
+    remotes_summaries: dict[Path, str] = {}
+
+    def remotes_summary(top: Path) -> str:
+        summary = remotes_summaries.get(top)
+        if summary is None:
+            summary = ";".join(sorted(f"{k}={canonicalize_remote(v)}" for k, v in remotes_by_top[top].items()))
+            remotes_summaries[top] = summary
+        return summary
+
+    # One selection row per candidate, filled in by whichever pass decides its fate.
+    selection_rows: list[dict[str, str]] = [{} for _ in candidates]
+    accepted: list[tuple[int, Path, Path, str, str, str]] = []
+    for i, (cand, top) in enumerate(zip(candidates, tops)):
         if top is None:
-            selection_rows.append({"candidate_path": str(cand), "status": "skipped", "reason": "not_a_git_repo_after_rev_parse"})
+            selection_rows[i] = {"candidate_path": str(cand), "status": "skipped", "reason": "not_a_git_repo_after_rev_parse"}
             continue
-        if excluded_pats:
-            try:
-                rel = top.resolve().relative_to(scan_root.resolve()).as_posix()
-            except Exception:
-                rel = top.as_posix()
-            full = top.as_posix()
-            if any(fnmatch.fnmatch(rel, pat) or fnmatch.fnmatch(full, pat) for pat in excluded_pats):
-                selection_rows.append(
-                    {
-                        "candidate_path": str(cand),
-                        "repo_path": str(top),
-                        "status": "skipped",
-                        "reason": "excluded_repo",
-                        "pattern": ",".join(excluded_pats[:5]),
-                    }
-                )
-                continue
-        remotes = get_remote_urls(top)
+        if excluded_by_pattern(top):
+            selection_rows[i] = {
+                "candidate_path": str(cand),
+                "repo_path": str(top),
+                "status": "skipped",
+                "reason": "excluded_repo",
+                "pattern": ",".join(excluded_pats[:5]),
+            }
+            continue
+        remotes = remotes_by_top[top]
         if not remotes:
-            selection_rows.append({"candidate_path": str(cand), "repo_path": str(top), "status": "skipped", "reason": "no_remotes"})
+            selection_rows[i] = {"candidate_path": str(cand), "repo_path": str(top), "status": "skipped", "reason": "no_remotes"}
             continue
         if exclude_forks:
             is_fork, fork_parent = detect_fork(remotes, fork_remote_names=fork_remote_names)
             if is_fork:
-                selection_rows.append(
-                    {
-                        "candidate_path": str(cand),
-                        "repo_path": str(top),
-                        "status": "skipped",
-                        "reason": "excluded_fork",
-                        "fork_parent": fork_parent,
-                        "remotes": ";".join(sorted(f"{k}={canonicalize_remote(v)}" for k, v in remotes.items())),
-                    }
-                )
-                continue
-        if not remotes_included(remotes, include_remote_prefixes, remote_filter_mode):
-            selection_rows.append(
-                {
+                selection_rows[i] = {
                     "candidate_path": str(cand),
                     "repo_path": str(top),
                     "status": "skipped",
-                    "reason": "remote_filter_no_match",
-                    "remotes": ";".join(sorted(f"{k}={canonicalize_remote(v)}" for k, v in remotes.items())),
+                    "reason": "excluded_fork",
+                    "fork_parent": fork_parent,
+                    "remotes": remotes_summary(top),
                 }
-            )
+                continue
+        if not remotes_included(remotes, include_remote_prefixes, remote_filter_mode):
+            selection_rows[i] = {
+                "candidate_path": str(cand),
+                "repo_path": str(top),
+                "status": "skipped",
+                "reason": "remote_filter_no_match",
+                "remotes": remotes_summary(top),
+            }
             continue
         remote_name, remote, remote_canonical = select_remote(remotes, include_prefixes=include_remote_prefixes, priority=remote_name_priority)
         if include_remote_prefixes and remote_filter_mode == "primary" and not remote_included(remote, include_remote_prefixes):
-            selection_rows.append(
-                {
-                    "candidate_path": str(cand),
-                    "repo_path": str(top),
-                    "status": "skipped",
-                    "reason": "primary_remote_not_included",
-                    "remote_name": remote_name,
-                    "remote_canonical": remote_canonical,
-                }
-            )
+            selection_rows[i] = {
+                "candidate_path": str(cand),
+                "repo_path": str(top),
+                "status": "skipped",
+                "reason": "primary_remote_not_included",
+                "remote_name": remote_name,
+                "remote_canonical": remote_canonical,
+            }
             continue
+        accepted.append((i, cand, top, remote_name, remote, remote_canonical))
 
+    # Every accepted clone needs its last commit (entry metadata or the freshest-clone choice below).
+    accepted_tops = list(dict.fromkeys(top for _, _, top, *_rest in accepted))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        last_commit_by_top = dict(zip(accepted_tops, ex.map(get_last_commit, accepted_tops)))
+
+    # Canonicalize and dedupe
+    by_key: dict[str, dict] = {}
+    for i, cand, top, remote_name, remote, remote_canonical in accepted:
         if dedupe == "remote" and remote_canonical:
             dedupe_key = remote_canonical
         else:
@@ -117,7 +143,7 @@ def discover_and_select_repos(
 
         entry = by_key.get(dedupe_key)
         if entry is None:
-            last_iso, last_ts = get_last_commit(top)
+            last_iso, last_ts = last_commit_by_top[top]
             by_key[dedupe_key] = {
                 "repo": top,
                 "repo_key": repo_key,
@@ -128,24 +154,22 @@ def discover_and_select_repos(
                 "last_ts": last_ts,
                 "last_iso": last_iso,
             }
-            selection_rows.append(
-                {
-                    "candidate_path": str(cand),
-                    "repo_path": str(top),
-                    "status": "included",
-                    "dedupe_key": dedupe_key,
-                    "repo_key": repo_key,
-                    "remote_name": remote_name,
-                    "remote_canonical": remote_canonical,
-                }
-            )
+            selection_rows[i] = {
+                "candidate_path": str(cand),
+                "repo_path": str(top),
+                "status": "included",
+                "dedupe_key": dedupe_key,
+                "repo_key": repo_key,
+                "remote_name": remote_name,
+                "remote_canonical": remote_canonical,
+            }
         else:
             dup_path = str(top)
             # Prefer the freshest clone for a deduped remote to avoid undercounting due to stale clones.
-            _, cand_ts = get_last_commit(top)
+            _, cand_ts = last_commit_by_top[top]
             entry_ts = entry.get("last_ts")
             if entry_ts is None:
-                _, entry_ts = get_last_commit(entry["repo"])
+                _, entry_ts = last_commit_by_top[entry["repo"]]
                 entry["last_ts"] = entry_ts
             prefer_new = cand_ts is not None and (entry_ts is None or cand_ts > entry_ts)
             if prefer_new:
@@ -158,33 +182,29 @@ def discover_and_select_repos(
                 entry["remote"] = remote
                 entry["remote_canonical"] = remote_canonical
                 entry["last_ts"] = cand_ts
-                selection_rows.append(
-                    {
-                        "candidate_path": str(cand),
-                        "repo_path": str(top),
-                        "status": "included",
-                        "dedupe_key": dedupe_key,
-                        "repo_key": repo_key,
-                        "remote_name": remote_name,
-                        "remote_canonical": remote_canonical,
-                        "note": f"replaced_clone:{prev_path}",
-                    }
-                )
+                selection_rows[i] = {
+                    "candidate_path": str(cand),
+                    "repo_path": str(top),
+                    "status": "included",
+                    "dedupe_key": dedupe_key,
+                    "repo_key": repo_key,
+                    "remote_name": remote_name,
+                    "remote_canonical": remote_canonical,
+                    "note": f"replaced_clone:{prev_path}",
+                }
             else:
                 if dup_path != str(entry["repo"]) and dup_path not in entry["dups"]:
                     entry["dups"].append(dup_path)
-                selection_rows.append(
-                    {
-                        "candidate_path": str(cand),
-                        "repo_path": str(top),
-                        "status": "duplicate",
-                        "dedupe_key": dedupe_key,
-                        "repo_key": repo_key,
-                        "remote_name": remote_name,
-                        "remote_canonical": remote_canonical,
-                        "note": f"kept_clone:{entry['repo']}",
-                    }
-                )
+                selection_rows[i] = {
+                    "candidate_path": str(cand),
+                    "repo_path": str(top),
+                    "status": "duplicate",
+                    "dedupe_key": dedupe_key,
+                    "repo_key": repo_key,
+                    "remote_name": remote_name,
+                    "remote_canonical": remote_canonical,
+                    "note": f"kept_clone:{entry['repo']}",
+                }
 
     repos_to_analyze = [
         (v.get("repo_key", _repo_key_for(k)), v["repo"], v.get("remote_name", ""), v["remote"], v.get("remote_canonical", ""), v["dups"])
@@ -193,3 +213,20 @@ def discover_and_select_repos(
     repos_to_analyze.sort(key=lambda x: x[1].as_posix())
 
     return candidates, repos_to_analyze, selection_rows
+
+
+def order_repos_largest_first(
+    repos_to_analyze: list[tuple[str, Path, str, str, str, list[str]]],
+    *,
+    jobs: int,
+) -> list[tuple[str, Path, str, str, str, list[str]]]:
+    # Longest-processing-time-first dispatch: submitting the biggest histories first lets their
+    # long tail overlap with the many small repos instead of trailing at the end of the run.
+    # Ties keep the incoming (path) order. With a single worker the order cannot change the wall time,
+    # so the commit counts (one full-history git walk per repo) are not worth fetching.
+    if len(repos_to_analyze) <= 1 or int(jobs) <= 1:
+        return list(repos_to_analyze)
+    with ThreadPoolExecutor(max_workers=max(1, min(int(jobs), len(repos_to_analyze)))) as ex:
+        counts = list(ex.map(lambda t: get_commit_count(t[1]) or 0, repos_to_analyze))
+    order = sorted(range(len(repos_to_analyze)), key=lambda i: -counts[i])
+    return [repos_to_analyze[i] for i in order]
@@ -1,52 +1,107 @@
 from __future__ import annotations
 
 import csv
+import io
 import json
-from collections import defaultdict
+import os
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from heapq import nsmallest
+from itertools import islice
+from operator import add, itemgetter
 from pathlib import Path
 
-from .analysis_aggregate import repo_period_stats
 from .identity import MeMatcher
 from .models import AuthorStats, RepoResult, RepoYearStats
 
 
+def _unique_preserve(items: Iterable[str]) -> list[str]:
+    return list(dict.fromkeys(items))
+
+
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def write_text_atomic(path: Path, text: str) -> None:
+    """Replace `path` via a temp file + os.replace; skip the write when the content is unchanged."""
+    data = text.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+    # A per-process temp name, so concurrent runs never write or rename each other's half-written file.
+    tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# Read-only default for periods a repo has no stats for.
+_NO_STATS = RepoYearStats()
+
+_CSV_BATCH_ROWS = 4096
+_CSV_FILE_BUFFER = 1 << 20
+
+
+def _write_csv(path: Path, header: Sequence[object], rows: Iterable[Iterable[object]]) -> None:
+    # Format rows into an in-memory buffer with writerows() and hand the file one large write per batch.
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(header)
+    it = iter(rows)
+    # Binary file: each batch (the first one carries the header) is encoded once, with no TextIOWrapper layer.
+    with path.open("wb", buffering=_CSV_FILE_BUFFER) as f:
+        while True:
+            # writerows() pulls straight from the row generator; an empty buffer means it ran dry.
+            writer.writerows(islice(it, _CSV_BATCH_ROWS))
+            if not buf.tell():
+                break
+            f.write(buf.getvalue().encode("utf-8"))
+            buf.seek(0)
+            buf.truncate(0)
+
+
+def run_writers(jobs: Sequence[tuple[Callable[..., None], tuple[object, ...]]], *, max_workers: int = 4) -> None:
+    """
+    Run independent `(writer, args)` jobs on a small thread pool and re-raise the first failure.
+
+    Jobs must target distinct files and only read their inputs (MeMatcher is safe to share).
+    """
+    if not jobs:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(int(max_workers), len(jobs)))) as ex:
+        futs = [ex.submit(fn, *args) for fn, args in jobs]
+    for fut in futs:
+        fut.result()
+
+
+# Report payloads are plain trees, so the cycle check is pure overhead; one encoder is reused for every file.
+_JSON_ENCODER = json.JSONEncoder(indent=2, sort_keys=False, check_circular=False)
+
+
 def write_json(path: Path, data: object) -> None:
-    path.write_text(json.dumps(data, indent=2, sort_keys=False), encoding="utf-8")
+    path.write_bytes(_JSON_ENCODER.encode(data).encode("utf-8"))
 
 
 def write_repo_selection_csv(path: Path, rows: list[dict[str, str]]) -> None:
     if not rows:
         return
-    fieldnames: list[str] = []
-    for r in rows:
-        for k in r.keys():
-            if k not in fieldnames:
-                fieldnames.append(k)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+    fieldnames = tuple(_unique_preserve(k for r in rows for k in r))
+    # Missing keys come back as None, which csv writes as an empty field (same as DictWriter's restval).
+    _write_csv(path, fieldnames, (map(r.get, fieldnames) for r in rows))
 
 
 def write_repo_selection_summary(path: Path, rows: list[dict[str, str]]) -> None:
-    counts_by_status: dict[str, int] = defaultdict(int)
-    counts_by_reason: dict[str, int] = defaultdict(int)
-    included_keys: set[str] = set()
-    for r in rows:
-        status = r.get("status", "") or ""
-        counts_by_status[status] += 1
-        reason = r.get("reason", "") or ""
-        if reason:
-            counts_by_reason[reason] += 1
-        if status == "included":
-            k = r.get("dedupe_key", "") or ""
-            if k:
-                included_keys.add(k)
+    counts_by_status = Counter(r.get("status", "") or "" for r in rows)
+    counts_by_reason = Counter(filter(None, (r.get("reason", "") or "" for r in rows)))
+    included_keys = {r.get("dedupe_key", "") or "" for r in rows if (r.get("status", "") or "") == "included"}
+    included_keys.discard("")
 
     summary = {
         "counts_by_status": dict(sorted(counts_by_status.items(), key=lambda kv: (-kv[1], kv[0]))),
@@ -57,65 +112,75 @@ def write_repo_selection_summary(path: Path, rows: list[dict[str, str]]) -> None
 
 
 def write_repos_csv(path: Path, repos: list[RepoResult], period_label: str, me: MeMatcher) -> None:
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "repo_key",
-                "repo_path",
-                "remote_name",
-                "remote_origin",
-                "remote_canonical",
-                "duplicate_paths",
-                "first_commit_iso",
-                "first_commit_by_me",
-                "last_commit_iso",
-                "commits_total_excl_bootstraps",
-                "commits_total_bootstraps",
-                "commits_total_including_bootstraps",
-                "changed_total_excl_bootstraps",
-                "changed_total_bootstraps",
-                "changed_total_including_bootstraps",
-                "commits_me_excl_bootstraps",
-                "commits_me_bootstraps",
-                "commits_me_including_bootstraps",
-                "changed_me_excl_bootstraps",
-                "changed_me_bootstraps",
-                "changed_me_including_bootstraps",
-            ]
-        )
+    # First commits are often by the same few people; match each (name, email) pair once.
+    is_me_map: dict[tuple[str, str], bool] = {}
+
+    def rows() -> Iterable[list[object]]:
         for r in repos:
-            ys_excl = r.period_stats_excl_bootstraps.get(period_label, RepoYearStats())
-            ys_boot = r.period_stats_bootstraps.get(period_label, RepoYearStats())
-            ys_incl = repo_period_stats(r, period_label, include_bootstraps=True)
+            commits_excl, changed_excl, commits_me_excl, changed_me_excl = r.period_stats_excl_bootstraps.get(
+                period_label, _NO_STATS
+            ).as_tuple()
+            commits_boot, changed_boot, commits_me_boot, changed_me_boot = r.period_stats_bootstraps.get(
+                period_label, _NO_STATS
+            ).as_tuple()
             first_by_me = False
             if r.first_commit_author_name and r.first_commit_author_email:
-                first_by_me = me.matches(r.first_commit_author_name, r.first_commit_author_email)
-            writer.writerow(
-                [
-                    r.key,
-                    r.path,
-                    r.remote_name,
-                    r.remote,
-                    r.remote_canonical,
-                    ";".join(r.duplicates),
-                    r.first_commit_iso or "",
-                    str(first_by_me),
-                    r.last_commit_iso or "",
-                    ys_excl.commits_total,
-                    ys_boot.commits_total,
-                    ys_incl.commits_total,
-                    ys_excl.changed_total,
-                    ys_boot.changed_total,
-                    ys_incl.changed_total,
-                    ys_excl.commits_me,
-                    ys_boot.commits_me,
-                    ys_incl.commits_me,
-                    ys_excl.changed_me,
-                    ys_boot.changed_me,
-                    ys_incl.changed_me,
-                ]
-            )
+                author = (r.first_commit_author_name, r.first_commit_author_email)
+                is_me = is_me_map.get(author)
+                if is_me is None:
+                    is_me = is_me_map[author] = me.matches(*author)
+                first_by_me = is_me
+            yield [
+                r.key,
+                r.path,
+                r.remote_name,
+                r.remote,
+                r.remote_canonical,
+                ";".join(r.duplicates),
+                r.first_commit_iso or "",
+                str(first_by_me),
+                r.last_commit_iso or "",
+                commits_excl,
+                commits_boot,
+                commits_excl + commits_boot,
+                changed_excl,
+                changed_boot,
+                changed_excl + changed_boot,
+                commits_me_excl,
+                commits_me_boot,
+                commits_me_excl + commits_me_boot,
+                changed_me_excl,
+                changed_me_boot,
+                changed_me_excl + changed_me_boot,
+            ]
+
+    _write_csv(
+        path,
+        [
+            "repo_key",
+            "repo_path",
+            "remote_name",
+            "remote_origin",
+            "remote_canonical",
+            "duplicate_paths",
+            "first_commit_iso",
+            "first_commit_by_me",
+            "last_commit_iso",
+            "commits_total_excl_bootstraps",
+            "commits_total_bootstraps",
+            "commits_total_including_bootstraps",
+            "changed_total_excl_bootstraps",
+            "changed_total_bootstraps",
+            "changed_total_including_bootstraps",
+            "commits_me_excl_bootstraps",
+            "commits_me_bootstraps",
+            "commits_me_including_bootstraps",
+            "changed_me_excl_bootstraps",
+            "changed_me_bootstraps",
+            "changed_me_including_bootstraps",
+        ],
+        rows(),
+    )
 
 
 def write_authors_csv(
@@ -123,248 +188,206 @@ def write_authors_csv(
     author_stats: dict[str, AuthorStats],
     me: MeMatcher,
 ) -> None:
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(["author_email", "author_name", "is_me", "commits", "insertions", "deletions", "changed"])
-        for email_key, st in sorted(author_stats.items(), key=lambda kv: (-kv[1].commits, kv[0])):
-            writer.writerow(
-                [
-                    st.email,
-                    st.name,
-                    str(me.matches(st.name, st.email)),
-                    st.commits,
-                    st.insertions,
-                    st.deletions,
-                    st.changed,
-                ]
+    is_me_map = {(st.name, st.email): str(me.matches(st.name, st.email)) for st in author_stats.values()}
+    _write_csv(
+        path,
+        ["author_email", "author_name", "is_me", "commits", "insertions", "deletions", "changed"],
+        (
+            (st.email, st.name, is_me_map[st.name, st.email], st.commits, st.insertions, st.deletions, st.changed)
+            for _neg_commits, _email_key, st in sorted(
+                ((-st.commits, email_key, st) for email_key, st in author_stats.items()), key=itemgetter(0, 1)
             )
+        ),
+    )
 
 
-def write_languages_csv(path: Path, languages: dict[str, dict[str, int]]) -> None:
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "language",
-                "insertions_total",
-                "deletions_total",
-                "changed_total",
-                "insertions_me",
-                "deletions_me",
-                "changed_me",
-                "insertions_others",
-                "deletions_others",
-                "changed_others",
-            ]
+_CHANGE_STATS_COLUMNS = (
+    "insertions_total",
+    "deletions_total",
+    "changed_total",
+    "insertions_me",
+    "deletions_me",
+    "changed_me",
+    "insertions_others",
+    "deletions_others",
+    "changed_others",
+)
+_CHANGE_STATS_KEYS = (
+    "insertions",
+    "deletions",
+    "changed",
+    "insertions_me",
+    "deletions_me",
+    "changed_me",
+    "insertions_others",
+    "deletions_others",
+    "changed_others",
+)
+
+
+def _change_stats_row(name: str, st: dict[str, int]) -> tuple[object, ...]:
+    return (name, *(int(st.get(k, 0)) for k in _CHANGE_STATS_KEYS))
+
+
+def _write_change_stats_csv(path: Path, first_column: str, stats: dict[str, dict[str, int]]) -> None:
+    rows = [
+        _change_stats_row(name, st)
+        for _neg_changed, _name_lower, name, st in sorted(
+            ((-int(st.get("changed", 0)), name.lower(), name, st) for name, st in stats.items()), key=itemgetter(0, 1)
         )
-        for lang, st in sorted(languages.items(), key=lambda kv: (-int(kv[1].get("changed", 0)), kv[0].lower())):
-            writer.writerow(
-                [
-                    lang,
-                    int(st.get("insertions", 0)),
-                    int(st.get("deletions", 0)),
-                    int(st.get("changed", 0)),
-                    int(st.get("insertions_me", 0)),
-                    int(st.get("deletions_me", 0)),
-                    int(st.get("changed_me", 0)),
-                    int(st.get("insertions_others", 0)),
-                    int(st.get("deletions_others", 0)),
-                    int(st.get("changed_others", 0)),
-                ]
-            )
+    ]
+    _write_csv(path, (first_column, *_CHANGE_STATS_COLUMNS), rows)
+
+
+def write_languages_csv(path: Path, languages: dict[str, dict[str, int]]) -> None:
+    _write_change_stats_csv(path, "language", languages)
 
 
 def write_dirs_csv(path: Path, dirs: dict[str, dict[str, int]]) -> None:
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "dir",
-                "insertions_total",
-                "deletions_total",
-                "changed_total",
-                "insertions_me",
-                "deletions_me",
-                "changed_me",
-                "insertions_others",
-                "deletions_others",
-                "changed_others",
-            ]
-        )
-        for d, st in sorted(dirs.items(), key=lambda kv: (-int(kv[1].get("changed", 0)), kv[0].lower())):
-            writer.writerow(
-                [
-                    d,
-                    int(st.get("insertions", 0)),
-                    int(st.get("deletions", 0)),
-                    int(st.get("changed", 0)),
-                    int(st.get("insertions_me", 0)),
-                    int(st.get("deletions_me", 0)),
-                    int(st.get("changed_me", 0)),
-                    int(st.get("insertions_others", 0)),
-                    int(st.get("deletions_others", 0)),
-                    int(st.get("changed_others", 0)),
-                ]
-            )
+    _write_change_stats_csv(path, "dir", dirs)
 
 
 def write_bootstrap_commits_csv(path: Path, repos: list[RepoResult], period_label: str) -> None:
-    rows: list[dict[str, object]] = []
+    keyed: list[tuple[tuple[int, str, str], tuple[object, ...]]] = []
     for r in repos:
         for c in r.bootstrap_commits_by_period.get(period_label, []):
-            row = dict(c)
-            row["repo_path"] = r.path
-            row["repo_key"] = r.key
-            row["remote_canonical"] = r.remote_canonical
-            row["remote_name"] = r.remote_name
-            row["remote_origin"] = r.remote
-            rows.append(row)
-
-    rows.sort(key=lambda d: (-int(d.get("changed", 0)), str(d.get("repo_key", "")), str(d.get("sha", ""))))
-
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "repo_key",
-                "repo_path",
-                "remote_canonical",
-                "sha",
-                "commit_iso",
-                "author_name",
-                "author_email",
-                "is_me",
-                "files_touched",
-                "insertions",
-                "deletions",
-                "changed",
-                "subject",
-            ]
-        )
-        for r in rows:
-            writer.writerow(
-                [
-                    r.get("repo_key", ""),
-                    r.get("repo_path", ""),
-                    r.get("remote_canonical", ""),
-                    r.get("sha", ""),
-                    r.get("commit_iso", ""),
-                    r.get("author_name", ""),
-                    r.get("author_email", ""),
-                    str(bool(r.get("is_me", False))),
-                    int(r.get("files_touched", 0)),
-                    int(r.get("insertions", 0)),
-                    int(r.get("deletions", 0)),
-                    int(r.get("changed", 0)),
-                    r.get("subject", ""),
-                ]
+            sha = c.get("sha", "")
+            changed = int(c.get("changed", 0))
+            row = (
+                r.key,
+                r.path,
+                r.remote_canonical,
+                sha,
+                c.get("commit_iso", ""),
+                c.get("author_name", ""),
+                c.get("author_email", ""),
+                str(bool(c.get("is_me", False))),
+                int(c.get("files_touched", 0)),
+                int(c.get("insertions", 0)),
+                int(c.get("deletions", 0)),
+                changed,
+                c.get("subject", ""),
             )
+            keyed.append(((-changed, str(r.key), str(sha)), row))
+
+    keyed.sort(key=itemgetter(0))
+
+    _write_csv(
+        path,
+        [
+            "repo_key",
+            "repo_path",
+            "remote_canonical",
+            "sha",
+            "commit_iso",
+            "author_name",
+            "author_email",
+            "is_me",
+            "files_touched",
+            "insertions",
+            "deletions",
+            "changed",
+            "subject",
+        ],
+        map(itemgetter(1), keyed),
+    )
 
 
 def write_top_commits_csv(path: Path, repos: list[RepoResult], period_labels: list[str], *, limit: int = 50) -> None:
-    wanted = list(dict.fromkeys([str(p) for p in (period_labels or []) if str(p).strip()]))
-    rows: list[dict[str, object]] = []
+    wanted = _unique_preserve(str(p) for p in (period_labels or []) if str(p).strip())
+    keyed: list[tuple[tuple[int, str, str], tuple[object, ...]]] = []
     for label in wanted:
         for r in repos:
             for c in r.top_commits_by_period.get(label, []):
-                row = dict(c)
-                row["period"] = label
-                row["repo_path"] = r.path
-                row["repo_key"] = r.key
-                row["remote_canonical"] = r.remote_canonical
-                row["remote_name"] = r.remote_name
-                row["remote_origin"] = r.remote
-                rows.append(row)
-
-    rows.sort(
-        key=lambda d: (
-            -int(d.get("changed", 0)),
-            str(d.get("repo_key", "")),
-            str(d.get("sha", "")),
-        )
-    )
+                sha = c.get("sha", "")
+                changed = int(c.get("changed", 0))
+                row = (
+                    label,
+                    r.key,
+                    r.path,
+                    r.remote_canonical,
+                    sha,
+                    c.get("commit_iso", ""),
+                    c.get("author_name", ""),
+                    c.get("author_email", ""),
+                    str(bool(c.get("is_me", False))),
+                    str(bool(c.get("is_bootstrap", False))),
+                    int(c.get("files_touched", 0)),
+                    int(c.get("insertions", 0)),
+                    int(c.get("deletions", 0)),
+                    changed,
+                    c.get("subject", ""),
+                )
+                keyed.append(((-changed, str(r.key), str(sha)), row))
+
+    # Only `limit` rows survive: a bounded heap selection (same result as sort + slice) beats sorting everything.
     if limit > 0:
-        rows = rows[:limit]
+        keyed = nsmallest(limit, keyed, key=itemgetter(0))
+    else:
+        keyed.sort(key=itemgetter(0))
 
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(
+    _write_csv(
+        path,
+        [
+            "period",
+            "repo_key",
+            "repo_path",
+            "remote_canonical",
+            "sha",
+            "commit_iso",
+            "author_name",
+            "author_email",
+            "is_me",
+            "is_bootstrap",
+            "files_touched",
+            "insertions",
+            "deletions",
+            "changed",
+            "subject",
+        ],
+        map(itemgetter(1), keyed),
+    )
+
+
+def write_repo_activity_csv(path: Path, repos: list[RepoResult], period_labels: list[str]) -> None:
+    labels = _unique_preserve(period_labels)
+    header = ["repo_path", "repo_key", "remote_canonical", "remote_name", "remote_origin"]
+    for label in labels:
+        header.extend(
             [
-                "period",
-                "repo_key",
-                "repo_path",
-                "remote_canonical",
-                "sha",
-                "commit_iso",
-                "author_name",
-                "author_email",
-                "is_me",
-                "is_bootstrap",
-                "files_touched",
-                "insertions",
-                "deletions",
-                "changed",
-                "subject",
+                f"commits_excl_bootstraps_{label}",
+                f"commits_bootstraps_{label}",
+                f"commits_including_bootstraps_{label}",
+                f"changed_excl_bootstraps_{label}",
+                f"changed_bootstraps_{label}",
+                f"changed_including_bootstraps_{label}",
             ]
         )
-        for r in rows:
-            writer.writerow(
-                [
-                    r.get("period", ""),
-                    r.get("repo_key", ""),
-                    r.get("repo_path", ""),
-                    r.get("remote_canonical", ""),
-                    r.get("sha", ""),
-                    r.get("commit_iso", ""),
-                    r.get("author_name", ""),
-                    r.get("author_email", ""),
-                    str(bool(r.get("is_me", False))),
-                    str(bool(r.get("is_bootstrap", False))),
-                    int(r.get("files_touched", 0)),
-                    int(r.get("insertions", 0)),
-                    int(r.get("deletions", 0)),
-                    int(r.get("changed", 0)),
-                    r.get("subject", ""),
-                ]
-            )
 
+    # Assemble column-major (one list per output column), then let zip() stitch rows together.
+    columns: list[list[object]] = [
+        [r.path for r in repos],
+        [r.key for r in repos],
+        [r.remote_canonical for r in repos],
+        [r.remote_name for r in repos],
+        [r.remote for r in repos],
+    ]
+    for label in labels:
+        excl = [r.period_stats_excl_bootstraps.get(label, _NO_STATS).as_tuple() for r in repos]
+        boot = [r.period_stats_bootstraps.get(label, _NO_STATS).as_tuple() for r in repos]
+        commits_excl = list(map(itemgetter(0), excl))
+        commits_boot = list(map(itemgetter(0), boot))
+        changed_excl = list(map(itemgetter(1), excl))
+        changed_boot = list(map(itemgetter(1), boot))
+        columns.extend(
+            [
+                commits_excl,
+                commits_boot,
+                list(map(add, commits_excl, commits_boot)),
+                changed_excl,
+                changed_boot,
+                list(map(add, changed_excl, changed_boot)),
+            ]
+        )
 
-def write_repo_activity_csv(path: Path, repos: list[RepoResult], period_labels: list[str]) -> None:
-    seen: set[str] = set()
-    labels: list[str] = []
-    for p in period_labels:
-        if p not in seen:
-            seen.add(p)
-            labels.append(p)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        header = ["repo_path", "repo_key", "remote_canonical", "remote_name", "remote_origin"]
-        for label in labels:
-            header.extend(
-                [
-                    f"commits_excl_bootstraps_{label}",
-                    f"commits_bootstraps_{label}",
-                    f"commits_including_bootstraps_{label}",
-                    f"changed_excl_bootstraps_{label}",
-                    f"changed_bootstraps_{label}",
-                    f"changed_including_bootstraps_{label}",
-                ]
-            )
-        writer.writerow(header)
-        for r in repos:
-            row = [r.path, r.key, r.remote_canonical, r.remote_name, r.remote]
-            for label in labels:
-                ys_excl = r.period_stats_excl_bootstraps.get(label, RepoYearStats())
-                ys_boot = r.period_stats_bootstraps.get(label, RepoYearStats())
-                ys_incl = repo_period_stats(r, label, include_bootstraps=True)
-                row.extend(
-                    [
-                        ys_excl.commits_total,
-                        ys_boot.commits_total,
-                        ys_incl.commits_total,
-                        ys_excl.changed_total,
-                        ys_boot.changed_total,
-                        ys_incl.changed_total,
-                    ]
-                )
-            writer.writerow(row)
+    _write_csv(path, header, zip(*columns))
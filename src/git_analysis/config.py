@@ -10,9 +10,11 @@ from .git import run_git
 
 
 def load_config(config_path: Path) -> dict:
-    if not config_path.exists():
+    try:
+        data = config_path.read_bytes()
+    except FileNotFoundError:
         return {}
-    return json.loads(config_path.read_text(encoding="utf-8"))
+    return json.loads(data)
 
 
 def save_config(config_path: Path, config: dict) -> None:
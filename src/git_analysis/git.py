@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 import subprocess
 from pathlib import Path
@@ -18,22 +19,66 @@ def run_git(args: list[str], cwd: Path, timeout_s: int = 300) -> tuple[int, str,
     return proc.returncode, proc.stdout, proc.stderr
 
 
-def discover_git_roots(root: Path, exclude_dirnames: set[str]) -> list[Path]:
-    roots: list[Path] = []
+class _GitQueryFailed(Exception):
+    def __init__(self, result: tuple[int, str, str]) -> None:
+        super().__init__(result[2])
+        self.result = result
+
 
-    def onerror(err: OSError) -> None:
-        _ = err
+@functools.lru_cache(maxsize=4096)
+def _run_git_cached(args: tuple[str, ...], cwd: str) -> tuple[int, str, str]:
+    result = run_git(list(args), Path(cwd))
+    if result[0] != 0 or not result[1].strip():
+        # lru_cache does not keep exceptions, so failures and empty answers (e.g. no commits yet) are retried.
+        raise _GitQueryFailed(result)
+    return result
 
-    for dirpath, dirnames, filenames in os.walk(root, onerror=onerror):
-        has_git = ".git" in dirnames or ".git" in filenames
+
+def _run_git_memo(args: list[str], cwd: Path) -> tuple[int, str, str]:
+    # Config setup, selection and analysis ask the same repos for their toplevel, remotes and last commit;
+    # successful, non-empty answers to those few queries are reused instead of spawning git again.
+    try:
+        return _run_git_cached(tuple(args), str(cwd))
+    except _GitQueryFailed as e:
+        return e.result
+
+
+def discover_git_roots(root: Path, exclude_dirnames: set[str]) -> list[Path]:
+    # Same pre-order walk (and result order) as os.walk(topdown=True), but the DirEntry type cached from
+    # scandir decides what to descend into, so there is no extra lstat per subdirectory and no file list.
+    # Unreadable directories are skipped silently; symlinked directories are not followed.
+    roots: list[Path] = []
+    stack = [os.fspath(root)]
+    while stack:
+        top = stack.pop()
+        try:
+            with os.scandir(top) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        has_git = False
+        subdirs: list[str] = []
+        for entry in entries:
+            name = entry.name
+            if name == ".git":
+                has_git = True
+                continue
+            if name in exclude_dirnames:
+                continue
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                subdirs.append(entry.path)
         if has_git:
-            roots.append(Path(dirpath))
-        dirnames[:] = [d for d in dirnames if d not in exclude_dirnames and d != ".git"]
+            roots.append(Path(top))
+        stack.extend(reversed(subdirs))
     return roots
 
 
 def get_repo_toplevel(candidate: Path) -> Optional[Path]:
-    code, out, _ = run_git(["rev-parse", "--show-toplevel"], cwd=candidate)
+    code, out, _ = _run_git_memo(["rev-parse", "--show-toplevel"], cwd=candidate)
     if code != 0:
         return None
     try:
@@ -49,6 +94,8 @@ def get_remote_origin(repo: Path) -> str:
     return ""
 
 
+# Pure string normalization, applied to the same remote URLs and include prefixes over and over during selection.
+@functools.lru_cache(maxsize=4096)
 def canonicalize_remote(remote: str) -> str:
     r = (remote or "").strip()
     if not r:
@@ -90,7 +137,7 @@ def remote_included(remote: str, include_prefixes: list[str]) -> bool:
 
 
 def get_remote_urls(repo: Path) -> dict[str, str]:
-    code, out, _ = run_git(["config", "--get-regexp", r"^remote\..*\.url$"], cwd=repo)
+    code, out, _ = _run_git_memo(["config", "--get-regexp", r"^remote\..*\.url$"], cwd=repo)
     if code != 0:
         return {}
     remotes: dict[str, str] = {}
@@ -179,7 +226,7 @@ def detect_fork(
 
 
 def get_last_commit(repo: Path) -> tuple[str | None, int | None]:
-    code, out, _ = run_git(["log", "-n", "1", "--format=%aI\t%ct", "--all"], cwd=repo)
+    code, out, _ = _run_git_memo(["log", "-n", "1", "--format=%aI\t%ct", "--all"], cwd=repo)
     if code != 0:
         return None, None
     line = out.strip()
@@ -196,6 +243,16 @@ def get_last_commit(repo: Path) -> tuple[str | None, int | None]:
     return iso, ts
 
 
+def get_commit_count(repo: Path) -> int | None:
+    code, out, _ = run_git(["rev-list", "--count", "--all"], cwd=repo)
+    if code != 0:
+        return None
+    try:
+        return int(out.strip())
+    except ValueError:
+        return None
+
+
 def get_first_commit(repo: Path) -> tuple[str | None, str | None, str | None]:
     code, out, _ = run_git(["log", "--reverse", "--format=%aI\t%an\t%ae", "-n", "1", "--all"], cwd=repo)
     if code != 0:
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import dataclasses
 import fnmatch
+import functools
+import re
 
 
+# Called for every commit's author; the distinct addresses in a run are few, so keep the normalized forms.
+@functools.lru_cache(maxsize=50_000)
 def normalize_email(email: str) -> str:
     return email.strip().lower()
 
@@ -34,6 +38,13 @@ def github_username_from_email(email: str) -> str:
     return normalize_github_username(local)
 
 
+def _compile_globs(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Fold fnmatch-style globs into one regex so a match is a single C-level scan."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
 @dataclasses.dataclass(frozen=True)
 class MeMatcher:
     emails: frozenset[str]
@@ -41,6 +52,12 @@ class MeMatcher:
     email_globs: tuple[str, ...] = ()
     name_globs: tuple[str, ...] = ()
     github_usernames: frozenset[str] = frozenset()
+    _email_glob_re: re.Pattern[str] | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    _name_glob_re: re.Pattern[str] | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_email_glob_re", _compile_globs(self.email_globs))
+        object.__setattr__(self, "_name_glob_re", _compile_globs(self.name_globs))
 
     def matches(self, author_name: str, author_email: str) -> bool:
         email = normalize_email(author_email)
@@ -54,13 +71,9 @@ class MeMatcher:
             return True
         if name and name in self.github_usernames:
             return True
-        if email:
-            for pat in self.email_globs:
-                if fnmatch.fnmatch(email, pat):
-                    return True
-        if name:
-            for pat in self.name_globs:
-                if fnmatch.fnmatch(name, pat):
-                    return True
+        if email and self._email_glob_re is not None and self._email_glob_re.match(email):
+            return True
+        if name and self._name_glob_re is not None and self._name_glob_re.match(name):
+            return True
         return False
 
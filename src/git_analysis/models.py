@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import dataclasses
+import datetime as dt
+import functools
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class AuthorStats:
     name: str = ""
     email: str = ""
@@ -16,7 +18,7 @@ class AuthorStats:
         return self.insertions + self.deletions
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RepoYearStats:
     commits_total: int = 0
     insertions_total: int = 0
@@ -33,6 +35,15 @@ class RepoYearStats:
     def changed_me(self) -> int:
         return self.insertions_me + self.deletions_me
 
+    def as_tuple(self) -> tuple[int, int, int, int]:
+        """(commits_total, changed_total, commits_me, changed_me) in one call, for row-building loops."""
+        return (
+            self.commits_total,
+            self.insertions_total + self.deletions_total,
+            self.commits_me,
+            self.insertions_me + self.deletions_me,
+        )
+
 
 @dataclasses.dataclass
 class RepoResult:
@@ -71,6 +82,16 @@ class RepoResult:
     top_commits_by_period: dict[str, list[dict[str, object]]]
     errors: list[str]
 
+    @functools.cached_property
+    def first_commit_date(self) -> dt.date | None:
+        """Calendar date of `first_commit_iso`, parsed once; None when missing or malformed."""
+        if not self.first_commit_iso:
+            return None
+        try:
+            return dt.date.fromisoformat(self.first_commit_iso[:10])
+        except ValueError:
+            return None
+
 
 @dataclasses.dataclass(frozen=True)
 class BootstrapConfig:
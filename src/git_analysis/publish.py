@@ -503,15 +503,11 @@ def build_upload_payload_from_results(
                 if changed > 0:
                     repo_changed_by_week.setdefault(wk, []).append(changed)
 
-            if r.first_commit_iso:
-                try:
-                    first_date = dt.date.fromisoformat(r.first_commit_iso[:10])
-                except ValueError:
-                    first_date = None
-                if first_date is not None and (p.start <= first_date < p.end):
-                    wk0 = _week_start_iso_from_commit_iso(r.first_commit_iso)
-                    if wk0:
-                        new_repos_by_week[wk0] = int(new_repos_by_week.get(wk0, 0)) + 1
+            first_date = r.first_commit_date
+            if first_date is not None and (p.start <= first_date < p.end):
+                wk0 = _week_start_iso_from_commit_iso(r.first_commit_iso or "")
+                if wk0:
+                    new_repos_by_week[wk0] = int(new_repos_by_week.get(wk0, 0)) + 1
 
         def rows(w: dict[str, dict[str, int]], tech: dict[str, dict[str, dict[str, int]]]) -> list[dict[str, object]]:
             out: list[dict[str, int | str]] = []
@@ -575,13 +571,9 @@ def build_upload_payload_from_results(
             deletions += int(st.deletions_me)
             if int(st.commits_me) > 0:
                 repos_active += 1
-            if r.first_commit_iso:
-                try:
-                    first_date = dt.date.fromisoformat(r.first_commit_iso[:10])
-                except ValueError:
-                    first_date = None
-                if first_date is not None and (p.start <= first_date < p.end):
-                    repos_new += 1
+            first_date = r.first_commit_date
+            if first_date is not None and (p.start <= first_date < p.end):
+                repos_new += 1
         year_totals.append(
             {
                 "year": year,
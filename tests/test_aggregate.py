@@ -1,7 +1,22 @@
 from __future__ import annotations
 
-from git_analysis.analysis_aggregate import repo_period_stats
-from git_analysis.models import RepoResult, RepoYearStats
+import dataclasses
+import datetime as dt
+
+from git_analysis.analysis_aggregate import (
+    aggregate_authors,
+    aggregate_authors_variants,
+    aggregate_dirs,
+    aggregate_dirs_variants,
+    aggregate_languages,
+    aggregate_languages_variants,
+    aggregate_period,
+    aggregate_period_variants,
+    repo_period_stats,
+)
+from git_analysis.analysis_periods import Period
+from git_analysis.identity import MeMatcher
+from git_analysis.models import AuthorStats, RepoResult, RepoYearStats
 
 
 def test_repo_period_stats_include_bootstraps() -> None:
@@ -50,3 +65,58 @@ def test_repo_period_stats_include_bootstraps() -> None:
     incl = repo_period_stats(r, period, include_bootstraps=True)
     assert incl.commits_total == 5
     assert incl.changed_total == (2 + 3) + (5 + 6)
+
+
+def _repo_result(*, first_commit_iso: str | None) -> RepoResult:
+    # Every per-period map starts empty; only the scalar identity fields need real values.
+    fields: dict[str, object] = {f.name: {} for f in dataclasses.fields(RepoResult)}
+    fields.update(key="k", path="/tmp/repo", remote_name="", remote="", remote_canonical="", duplicates=[], errors=[])
+    fields.update(first_commit_author_name=None, first_commit_author_email=None, last_commit_iso=None)
+    fields["first_commit_iso"] = first_commit_iso
+    return RepoResult(**fields)  # type: ignore[arg-type]
+
+
+def test_repo_result_first_commit_date_parses_once_and_tolerates_bad_values() -> None:
+    r = _repo_result(first_commit_iso="2025-03-04T05:06:07+02:00")
+    assert r.first_commit_date == dt.date(2025, 3, 4)
+    assert _repo_result(first_commit_iso=None).first_commit_date is None
+    assert _repo_result(first_commit_iso="not-a-date").first_commit_date is None
+
+
+def test_aggregate_variants_match_separate_passes() -> None:
+    period = Period(label="2025", start=dt.date(2025, 1, 1), end=dt.date(2026, 1, 1))
+    me = MeMatcher(frozenset({"me@example.com"}), frozenset())
+    a = _repo_result(first_commit_iso="2025-02-01T00:00:00+00:00")
+    a.first_commit_author_name = "Me"
+    a.first_commit_author_email = "me@example.com"
+    a.period_stats_excl_bootstraps = {"2025": RepoYearStats(commits_total=2, insertions_total=3, deletions_total=1, commits_me=1, insertions_me=1, deletions_me=0)}
+    a.period_stats_bootstraps = {"2025": RepoYearStats(commits_total=1, insertions_total=900, deletions_total=0, commits_me=1, insertions_me=900, deletions_me=0)}
+    a.authors_by_period_excl_bootstraps = {"2025": {"me@example.com": AuthorStats(name="Me", email="me@example.com", commits=1, insertions=1, deletions=0)}}
+    a.authors_by_period_bootstraps = {"2025": {"me@example.com": AuthorStats(name="Me", email="me@example.com", commits=1, insertions=900, deletions=0)}}
+    a.languages_by_period_excl_bootstraps = {"2025": {"Python": {"insertions": 3, "deletions": 1, "insertions_me": 1, "deletions_me": 0}}}
+    a.languages_by_period_bootstraps = {"2025": {"JSON": {"insertions": 900, "deletions": 0, "insertions_me": 900, "deletions_me": 0}}}
+    a.dirs_by_period_excl_bootstraps = {"2025": {"src": {"insertions": 3, "deletions": 1, "insertions_me": 1, "deletions_me": 0}}}
+    b = _repo_result(first_commit_iso="2019-01-01T00:00:00+00:00")
+    b.period_stats_bootstraps = {"2025": RepoYearStats(commits_total=1, insertions_total=5, deletions_total=5, commits_me=0, insertions_me=0, deletions_me=0)}
+    b.languages_by_period_bootstraps = {"2025": {"Python": {"insertions": 5, "deletions": 5, "insertions_me": 0, "deletions_me": 0}}}
+    repos = [a, b]
+
+    assert aggregate_period_variants(repos, period, me) == (
+        aggregate_period(repos, period, me, include_bootstraps=False),
+        aggregate_period(repos, period, me, include_bootstraps=False, bootstraps_only=True),
+        aggregate_period(repos, period, me, include_bootstraps=True),
+    )
+    for variants, separate in (
+        (aggregate_authors_variants, aggregate_authors),
+        (aggregate_languages_variants, aggregate_languages),
+        (aggregate_dirs_variants, aggregate_dirs),
+    ):
+        assert variants(repos, "2025") == (
+            separate(repos, "2025", include_bootstraps=False),
+            separate(repos, "2025", include_bootstraps=False, bootstraps_only=True),
+            separate(repos, "2025", include_bootstraps=True),
+        )
+
+    incl = aggregate_languages_variants(repos, "2025")[2]
+    assert incl["Python"]["changed"] == 4 + 10
+    assert list(incl) == ["Python", "JSON"]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+import os
+import runpy
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+# Lines that name the run itself rather than what was analyzed.
+_RUN_SPECIFIC_KEYS = ('"generated_at"', '"reports_dir"')
+
+
+def _run(cmd: list[str], *, cwd: Path, env: dict[str, str] | None = None) -> str:
+    proc = subprocess.run(cmd, cwd=str(cwd), env=env, check=True, capture_output=True, text=True)
+    return proc.stdout
+
+
+def _init_repo(*, repo: Path, remote: str, commits: list[tuple[str, str, str]]) -> None:
+    repo.mkdir(parents=True)
+    _run(["git", "init"], cwd=repo)
+    _run(["git", "remote", "add", "origin", remote], cwd=repo)
+    for i, (author, filename, date) in enumerate(commits):
+        p = repo / filename
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(f"{i}\n" * (i + 1), encoding="utf-8")
+        _run(["git", "add", filename], cwd=repo)
+        env = os.environ.copy()
+        env.update(
+            GIT_AUTHOR_NAME=author,
+            GIT_AUTHOR_EMAIL=f"{author.lower()}@example.com",
+            GIT_COMMITTER_NAME=author,
+            GIT_COMMITTER_EMAIL=f"{author.lower()}@example.com",
+            GIT_AUTHOR_DATE=date,
+            GIT_COMMITTER_DATE=date,
+        )
+        _run(["git", "commit", "-m", f"{author}: {filename}, part {i}"], cwd=repo, env=env)
+
+
+def _analyze(*, module: str, jobs: int, scan_root: Path, config_path: Path, cwd: Path) -> Path:
+    cwd.mkdir()
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(ROOT / "src")
+    cmd = [
+        str(ROOT / ".venv" / "bin" / "python"),
+        "-m",
+        module,
+        "--root",
+        str(scan_root),
+        "--years",
+        "2024",
+        "2025",
+        "--config",
+        str(config_path),
+        "--jobs",
+        str(jobs),
+        "--publish",
+        "no",
+    ]
+    proc = subprocess.run(cmd, cwd=str(cwd), env=env, input="n\n", text=True, capture_output=True)
+    assert proc.returncode == 0, proc.stderr
+    latest = (cwd / "reports" / "latest.txt").read_text(encoding="utf-8").strip()
+    return cwd / "reports" / latest
+
+
+def _report_files(report_dir: Path) -> dict[str, list[str]]:
+    return {
+        p.relative_to(report_dir).as_posix(): [
+            line for line in p.read_text(encoding="utf-8").splitlines() if not line.lstrip().startswith(_RUN_SPECIFIC_KEYS)
+        ]
+        for p in sorted(report_dir.rglob("*"))
+        if p.is_file()
+    }
+
+
+def test_worker_processes_write_the_same_reports_as_a_single_job(tmp_path: Path) -> None:
+    scan_root = tmp_path / "scan"
+    _init_repo(
+        repo=scan_root / "a",
+        remote="git@github.com:org/a.git",
+        commits=[
+            ("Me", "src/main.py", "2024-03-01T12:00:00Z"),
+            ("Other", "README.md", "2024-09-01T12:00:00Z"),
+            ("Me", "src/main.py", "2025-02-01T12:00:00Z"),
+        ],
+    )
+    _init_repo(
+        repo=scan_root / "b",
+        remote="git@github.com:org/b.git",
+        commits=[
+            ("Other", "lib/util.go", "2025-01-15T12:00:00Z"),
+            ("Me", "lib/util.go", "2025-06-01T12:00:00Z"),
+        ],
+    )
+    _init_repo(
+        repo=scan_root / "c",
+        remote="git@github.com:org/c.git",
+        commits=[("Me", "docs/guide.md", "2025-04-01T12:00:00Z")],
+    )
+
+    config_path = tmp_path / "config.json"
+    # A glob as well as a plain address, so the matcher's compiled pattern has to survive pickling to the workers.
+    config_path.write_text(
+        json.dumps(
+            {
+                "me_emails": ["me@example.com"],
+                "me_email_globs": ["me+*@example.com"],
+                "upload_config": {"default_publish": False},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    # `python -m git_analysis` runs __main__.py, which the worker processes must be able to import without re-running the CLI.
+    pooled = _analyze(module="git_analysis", jobs=2, scan_root=scan_root, config_path=config_path, cwd=tmp_path / "jobs2")
+    single = _analyze(module="git_analysis.cli", jobs=1, scan_root=scan_root, config_path=config_path, cwd=tmp_path / "jobs1")
+
+    pooled_files = _report_files(pooled)
+    assert pooled_files == _report_files(single)
+    # The workers matched "me": every 2025 repo has one of my commits.
+    repos_csv = pooled_files["csv/year_2025_repos.csv"]
+    me_col = repos_csv[0].split(",").index("commits_me_excl_bootstraps")
+    assert [row.split(",")[me_col] for row in repos_csv[1:]] == ["1", "1", "1"]
+
+
+def test_main_module_does_not_rerun_the_cli_when_imported_by_spawned_workers(monkeypatch) -> None:
+    import git_analysis.cli
+
+    def fail() -> int:
+        raise AssertionError("the CLI ran inside a worker")
+
+    monkeypatch.setattr(git_analysis.cli, "main", fail)
+    # This is how the "spawn" start method re-imports a `python -m git_analysis` parent in each worker.
+    runpy.run_module("git_analysis", run_name="__mp_main__")
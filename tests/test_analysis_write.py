@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import csv
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+from git_analysis.analysis_write import (
+    run_writers,
+    write_bootstrap_commits_csv,
+    write_dirs_csv,
+    write_repo_activity_csv,
+    write_repo_selection_csv,
+    write_text_atomic,
+    write_top_commits_csv,
+)
+from git_analysis.models import RepoResult, RepoYearStats
+
+# Every character csv.writer has to quote for, in both a path and a free-text subject.
+_AWKWARD_PATH = '/tmp/a, "b"'
+_AWKWARD_SUBJECT = 'fix: a, "b"\r\nand c'
+
+
+def _repo_with_commit() -> RepoResult:
+    commit = {
+        "sha": "abc",
+        "commit_iso": "2025-01-02T03:04:05+00:00",
+        "author_name": "Doe, Jane",
+        "author_email": "jane@example.com",
+        "is_me": True,
+        "is_bootstrap": False,
+        "files_touched": 1,
+        "insertions": 2,
+        "deletions": 3,
+        "changed": 5,
+        "subject": _AWKWARD_SUBJECT,
+    }
+    return RepoResult(
+        key="k",
+        path=_AWKWARD_PATH,
+        remote_name="origin",
+        remote="git@github.com:org/repo.git",
+        remote_canonical="github.com/org/repo",
+        duplicates=[],
+        first_commit_iso=None,
+        first_commit_author_name=None,
+        first_commit_author_email=None,
+        last_commit_iso=None,
+        period_stats_excl_bootstraps={"2025": RepoYearStats(commits_total=1, insertions_total=2, deletions_total=3)},
+        period_stats_bootstraps={},
+        weekly_by_period_excl_bootstraps={},
+        weekly_by_period_bootstraps={},
+        weekly_tech_by_period_excl_bootstraps={},
+        weekly_tech_by_period_bootstraps={},
+        me_weekly_by_period_excl_bootstraps={},
+        me_weekly_by_period_bootstraps={},
+        me_weekly_tech_by_period_excl_bootstraps={},
+        me_weekly_tech_by_period_bootstraps={},
+        authors_by_period_excl_bootstraps={},
+        authors_by_period_bootstraps={},
+        languages_by_period_excl_bootstraps={},
+        languages_by_period_bootstraps={},
+        dirs_by_period_excl_bootstraps={},
+        dirs_by_period_bootstraps={},
+        me_monthly_by_period_excl_bootstraps={},
+        me_monthly_by_period_bootstraps={},
+        me_monthly_tech_by_period_excl_bootstraps={},
+        me_monthly_tech_by_period_bootstraps={},
+        excluded_by_period={},
+        bootstrap_commits_by_period={"2025": [commit]},
+        top_commits_by_period={"2025": [commit]},
+        errors=[],
+    )
+
+
+def _read_csv(path: Path) -> list[dict[str, str]]:
+    return list(csv.DictReader(io.StringIO(path.read_bytes().decode("utf-8"), newline="")))
+
+
+def test_write_text_atomic_replaces_and_skips_identical_content(tmp_path: Path) -> None:
+    path = tmp_path / "latest.txt"
+    write_text_atomic(path, "a/1\n")
+    assert path.read_text(encoding="utf-8") == "a/1\n"
+
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    write_text_atomic(path, "a/1\n")
+    assert path.stat().st_mtime_ns == 1_000_000_000
+
+    write_text_atomic(path, "b/2\n")
+    assert path.read_text(encoding="utf-8") == "b/2\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["latest.txt"]
+
+
+def test_write_text_atomic_removes_its_temp_file_when_the_replace_fails(tmp_path: Path) -> None:
+    # os.replace cannot put a file over a directory.
+    (tmp_path / "latest.txt").mkdir()
+    with pytest.raises(OSError):
+        write_text_atomic(tmp_path / "latest.txt", "a/1\n")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["latest.txt"]
+
+
+def test_write_repo_selection_csv_unions_columns_in_first_seen_order(tmp_path: Path) -> None:
+    path = tmp_path / "repo_selection.csv"
+    write_repo_selection_csv(path, [{"status": "included", "path": "/a"}, {"status": "skipped", "reason": "fork"}])
+    assert path.read_text(encoding="utf-8").splitlines() == [
+        "status,path,reason",
+        "included,/a,",
+        "skipped,,fork",
+    ]
+
+
+def test_run_writers_runs_every_job_and_reraises_failures(tmp_path: Path) -> None:
+    def write(path: Path, text: str) -> None:
+        path.write_text(text, encoding="utf-8")
+
+    def fail() -> None:
+        raise OSError("disk full")
+
+    run_writers([(write, (tmp_path / f"{i}.txt", str(i))) for i in range(6)])
+    assert sorted(p.read_text(encoding="utf-8") for p in tmp_path.iterdir()) == ["0", "1", "2", "3", "4", "5"]
+
+    with pytest.raises(OSError, match="disk full"):
+        run_writers([(write, (tmp_path / "x.txt", "x")), (fail, ())])
+    assert (tmp_path / "x.txt").read_text(encoding="utf-8") == "x"
+
+
+def test_commit_and_activity_csvs_round_trip_fields_that_need_quoting(tmp_path: Path) -> None:
+    repos = [_repo_with_commit()]
+    write_bootstrap_commits_csv(tmp_path / "bootstrap.csv", repos, "2025")
+    write_top_commits_csv(tmp_path / "top.csv", repos, ["2025"])
+    write_repo_activity_csv(tmp_path / "activity.csv", repos, ["2025"])
+
+    for name in ("bootstrap.csv", "top.csv"):
+        (row,) = _read_csv(tmp_path / name)
+        assert row["repo_path"] == _AWKWARD_PATH
+        assert row["author_name"] == "Doe, Jane"
+        assert row["subject"] == _AWKWARD_SUBJECT
+        assert (row["is_me"], row["changed"]) == ("True", "5")
+
+    (row,) = _read_csv(tmp_path / "activity.csv")
+    assert row["repo_path"] == _AWKWARD_PATH
+    assert row["commits_including_bootstraps_2025"] == "1"
+
+
+def test_dirs_csv_quotes_names_and_orders_by_changed(tmp_path: Path) -> None:
+    path = tmp_path / "dirs.csv"
+    write_dirs_csv(path, {"src": {"insertions": 1, "changed": 1}, 'a,"b"': {"insertions": 3, "changed": 3}})
+    assert path.read_bytes().split(b"\r\n")[1].startswith(b'"a,""b""",3,')
+    assert [(row["dir"], row["changed_total"]) for row in _read_csv(path)] == [('a,"b"', "3"), ("src", "1")]
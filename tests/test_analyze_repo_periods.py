@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import datetime as dt
+import os
+import subprocess
+from pathlib import Path
+
+from git_analysis.analysis_periods import Period
+from git_analysis.analysis_repo import analyze_repo, parse_numstat_stream_multi
+from git_analysis.identity import MeMatcher
+from git_analysis.models import BootstrapConfig
+
+
+def _run(cmd: list[str], *, cwd: Path, env: dict[str, str] | None = None) -> str:
+    proc = subprocess.run(cmd, cwd=str(cwd), env=env, check=True, capture_output=True, text=True)
+    return proc.stdout
+
+
+def _commit(*, repo: Path, filename: str, message: str, author_date: str, committer_date: str) -> None:
+    (repo / filename).write_text(f"{message}\n", encoding="utf-8")
+    _run(["git", "add", filename], cwd=repo)
+    env = os.environ.copy()
+    env["GIT_AUTHOR_DATE"] = author_date
+    env["GIT_COMMITTER_DATE"] = committer_date
+    _run(["git", "commit", "-m", message], cwd=repo, env=env)
+
+
+def test_analyze_repo_buckets_one_log_walk_by_committer_time(tmp_path: Path) -> None:
+    repo = tmp_path / "r"
+    repo.mkdir()
+    _run(["git", "init"], cwd=repo)
+    _run(["git", "config", "user.name", "Test User"], cwd=repo)
+    _run(["git", "config", "user.email", "test@example.com"], cwd=repo)
+
+    _commit(repo=repo, filename="a.txt", message="a", author_date="2024-06-01T12:00:00Z", committer_date="2024-06-01T12:00:00Z")
+    # Authored in 2024 but committed in 2025: git's --since/--before use committer time, so it belongs to 2025.
+    _commit(repo=repo, filename="b.txt", message="b\twith tab", author_date="2024-12-20T12:00:00Z", committer_date="2025-01-10T12:00:00Z")
+    _commit(repo=repo, filename="c.txt", message="c", author_date="2025-08-01T12:00:00Z", committer_date="2025-08-01T12:00:00Z")
+
+    periods = [
+        Period(label="2024", start=dt.date(2024, 1, 1), end=dt.date(2025, 1, 1)),
+        Period(label="2025", start=dt.date(2025, 1, 1), end=dt.date(2026, 1, 1)),
+        Period(label="2025H2", start=dt.date(2025, 7, 1), end=dt.date(2026, 1, 1)),
+    ]
+    r = analyze_repo(
+        repo=repo,
+        key="k",
+        remote_name="",
+        remote="",
+        remote_canonical="",
+        duplicates=[],
+        periods=periods,
+        include_merges=True,
+        me=MeMatcher(frozenset(), frozenset()),
+        bootstrap=BootstrapConfig(changed_threshold=10_000, files_threshold=10_000, addition_ratio=1.0),
+        exclude_path_prefixes=[],
+        exclude_path_globs=[],
+    )
+
+    assert r.errors == []
+    assert {label: st.commits_total for label, st in r.period_stats_excl_bootstraps.items()} == {
+        "2024": 1,
+        "2025": 2,
+        "2025H2": 1,
+    }
+    assert sorted(c["subject"] for c in r.top_commits_by_period["2025"]) == ["b\twith tab", "c"]
+
+
+def test_analyze_repo_reads_renamed_and_special_paths_verbatim(tmp_path: Path) -> None:
+    repo = tmp_path / "r"
+    (repo / "src" / "old").mkdir(parents=True)
+    _run(["git", "init"], cwd=repo)
+    _run(["git", "config", "user.name", "Test User"], cwd=repo)
+    _run(["git", "config", "user.email", "test@example.com"], cwd=repo)
+
+    (repo / "src" / "old" / "mod.py").write_text("a\nb\n", encoding="utf-8")
+    # git quotes this path in plain --numstat output because of the quote and the non-ASCII byte.
+    _commit(repo=repo, filename='q"\u00e9 t.md', message="seed", author_date="2025-02-01T12:00:00Z", committer_date="2025-02-01T12:00:00Z")
+    _run(["git", "add", "-A"], cwd=repo)
+    _run(["git", "commit", "--amend", "--no-edit"], cwd=repo, env={**os.environ, "GIT_COMMITTER_DATE": "2025-02-01T12:00:00Z"})
+    _run(["git", "mv", "src/old", "src/new"], cwd=repo)
+    (repo / "src" / "new" / "mod.py").write_text("a\nb\nc\n", encoding="utf-8")
+    _commit(repo=repo, filename="src/new/mod.py", message="rename", author_date="2025-03-01T12:00:00Z", committer_date="2025-03-01T12:00:00Z")
+
+    r = analyze_repo(
+        repo=repo,
+        key="k",
+        remote_name="",
+        remote="",
+        remote_canonical="",
+        duplicates=[],
+        periods=[Period(label="2025", start=dt.date(2025, 1, 1), end=dt.date(2026, 1, 1))],
+        include_merges=True,
+        me=MeMatcher(frozenset(), frozenset()),
+        bootstrap=BootstrapConfig(changed_threshold=10_000, files_threshold=10_000, addition_ratio=1.0),
+        exclude_path_prefixes=[],
+        exclude_path_globs=["src/old/*"],
+    )
+
+    assert r.errors == []
+    langs = r.languages_by_period_excl_bootstraps["2025"]
+    assert langs["Markdown"]["insertions"] == 1
+    # The renamed file is attributed to its full destination path, not a brace-collapsed fragment of it.
+    assert langs["Python"]["insertions"] == 1
+    assert r.dirs_by_period_excl_bootstraps["2025"]["src"]["insertions"] == 1
+
+
+def test_parse_numstat_stream_multi_skips_git_when_every_period_starts_after_last_commit(tmp_path: Path) -> None:
+    periods = [
+        Period(label="2025", start=dt.date(2025, 1, 1), end=dt.date(2026, 1, 1)),
+        Period(label="2026H1", start=dt.date(2026, 1, 1), end=dt.date(2026, 7, 1)),
+    ]
+    last_commit_ts = int(dt.datetime(2024, 12, 31, 23, 59, 59, tzinfo=dt.timezone.utc).timestamp())
+
+    # The directory is not a repository: running git here would report an error.
+    results, errors = parse_numstat_stream_multi(
+        repo=tmp_path,
+        periods=periods,
+        include_merges=True,
+        me=MeMatcher(frozenset(), frozenset()),
+        bootstrap=BootstrapConfig(),
+        exclude_path_prefixes=[],
+        exclude_path_globs=[],
+        last_commit_ts=last_commit_ts,
+    )
+
+    assert errors == []
+    assert [r[0].commits_total for r in results] == [0, 0]
@@ -26,7 +26,7 @@ def test_bootstrap_exclude_sha_forces_non_bootstrap(tmp_path: Path, monkeypatch)
                 "def main() -> int:",
                 "    if len(sys.argv) > 1 and sys.argv[1] == 'log':",
                 f"        sys.stdout.write('@@@{sha}\\tA\\ta@e\\t2025-01-01T00:00:00Z\\tsub\\n')",
-                "        sys.stdout.write('10\\t0\\tfile.py\\n')",
+                "        sys.stdout.write('10\\t0\\tfile.py\\0')",
                 "        sys.stdout.flush()",
                 "        return 0",
                 "    return 2",
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from git_analysis.identity import MeMatcher
+
+
+def test_me_matcher_globs() -> None:
+    me = MeMatcher(
+        frozenset(),
+        frozenset(),
+        email_globs=("*@example.com", "dev+*@corp.test"),
+        name_globs=("jane*",),
+    )
+
+    assert me.matches("Someone", "a@example.com") is True
+    assert me.matches("Someone", "DEV+ci@corp.test") is True
+    assert me.matches("Jane Doe", "jane@elsewhere.test") is True
+    assert me.matches("Someone", "a@example.com.evil") is False
+    assert me.matches("John", "john@elsewhere.test") is False
+
+
+def test_me_matcher_without_globs_matches_literals_only() -> None:
+    me = MeMatcher(frozenset({"me@example.com"}), frozenset({"me"}))
+
+    assert me.matches("Other", "ME@example.com") is True
+    assert me.matches("Me", "other@example.com") is True
+    assert me.matches("Other", "other@example.com") is False
+    assert me == MeMatcher(frozenset({"me@example.com"}), frozenset({"me"}))
@@ -51,12 +51,12 @@ def test_parse_numstat_stream_does_not_deadlock_on_stderr(tmp_path: Path) -> Non
                 "def main() -> int:",
                 "    if len(sys.argv) > 1 and sys.argv[1] == 'log':",
                 "        sys.stdout.write('@@@a\\tA\\ta@e\\t2025-01-01T00:00:00Z\\tsub\\n')",
-                "        sys.stdout.write('1\\t0\\tfile.py\\n')",
+                "        sys.stdout.write('1\\t0\\tfile.py\\0')",
                 "        sys.stdout.flush()",
                 "        sys.stderr.write('E' * (2 * 1024 * 1024))",
                 "        sys.stderr.flush()",
-                "        sys.stdout.write('@@@b\\tB\\tb@e\\t2025-01-02T00:00:00Z\\tsub2\\n')",
-                "        sys.stdout.write('2\\t0\\tfile2.py\\n')",
+                "        sys.stdout.write('\\0@@@b\\tB\\tb@e\\t2025-01-02T00:00:00Z\\tsub2\\n')",
+                "        sys.stdout.write('2\\t0\\tfile2.py\\0')",
                 "        sys.stdout.flush()",
                 "        return 0",
                 "    sys.stderr.write('unexpected args: ' + ' '.join(sys.argv) + '\\n')",
@@ -1,11 +1,6 @@
 from __future__ import annotations
 
-from git_analysis.analysis_paths import dir_key_for_path, language_for_path, normalize_numstat_path, should_exclude_path
-
-
-def test_normalize_numstat_path_rename_braces() -> None:
-    assert normalize_numstat_path("src/{old => new}/file.py") == "new/file.py"
-    assert normalize_numstat_path("src/{old.py => new.py}") == "new.py"
+from git_analysis.analysis_paths import build_exclude_matcher, dir_key_for_path, language_for_path, should_exclude_path
 
 
 def test_language_for_path() -> None:
@@ -27,3 +22,11 @@ def test_should_exclude_path_prefixes_and_globs() -> None:
     assert should_exclude_path("src/app.py", [], ["*.py"]) is True
     assert should_exclude_path("src/app.js", [], ["*.py"]) is False
 
+
+def test_build_exclude_matcher_combines_prefixes_and_globs() -> None:
+    is_excluded = build_exclude_matcher(("./dist/", "node_modules", ""), ("*.min.js", ""))
+    assert is_excluded("dist/app.js") is True
+    assert is_excluded("web/node_modules/x/index.js") is True
+    assert is_excluded("src/vendor.min.js") is True
+    assert is_excluded("src/distant/app.js") is False
+    assert build_exclude_matcher((), ())("anything") is False
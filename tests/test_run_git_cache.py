@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from git_analysis import git
+
+
+def test_repo_probes_spawn_git_once_and_retry_failures(tmp_path: Path, monkeypatch) -> None:
+    repo = tmp_path / "r"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=str(repo), check=True)
+    calls: list[list[str]] = []
+    real_run = subprocess.run
+
+    def counting_run(cmd, *args, **kwargs):
+        calls.append(list(cmd))
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(git.subprocess, "run", counting_run)
+
+    top = git.get_repo_toplevel(repo)
+    assert top is not None
+    assert git.get_repo_toplevel(repo) == top
+    assert len(calls) == 1
+
+    # No commits yet: an empty answer is not remembered, so it sees the commit made afterwards.
+    assert git.get_last_commit(repo) == (None, None)
+    assert len(calls) == 2
+    monkeypatch.setattr(git.subprocess, "run", real_run)
+    subprocess.run(
+        ["git", "-c", "user.name=T", "-c", "user.email=t@example.com", "commit", "-q", "--allow-empty", "-m", "a"],
+        cwd=str(repo),
+        check=True,
+    )
+    monkeypatch.setattr(git.subprocess, "run", counting_run)
+    assert git.get_last_commit(repo)[1] is not None
+    assert git.get_last_commit(repo)[1] is not None
+    assert len(calls) == 3
+
+    # Other git commands always run.
+    git.run_git(["rev-parse", "--show-toplevel"], cwd=repo)
+    assert len(calls) == 4
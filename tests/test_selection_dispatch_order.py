@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+from git_analysis.analysis_selection import discover_and_select_repos, order_repos_largest_first
+
+
+def _run(cmd: list[str], *, cwd: Path, env: dict[str, str] | None = None) -> str:
+    proc = subprocess.run(cmd, cwd=str(cwd), env=env, check=True, capture_output=True, text=True)
+    return proc.stdout
+
+
+def _init_repo(*, repo: Path, remote: str, commits: int) -> None:
+    repo.mkdir(parents=True, exist_ok=True)
+    _run(["git", "init"], cwd=repo)
+    _run(["git", "config", "user.name", "Test User"], cwd=repo)
+    _run(["git", "config", "user.email", "test@example.com"], cwd=repo)
+    _run(["git", "remote", "add", "origin", remote], cwd=repo)
+    env = os.environ.copy()
+    env["GIT_AUTHOR_DATE"] = "2025-01-01T00:00:00Z"
+    env["GIT_COMMITTER_DATE"] = "2025-01-01T00:00:00Z"
+    for i in range(commits):
+        (repo / "a.txt").write_text(f"{i}\n", encoding="utf-8")
+        _run(["git", "add", "a.txt"], cwd=repo)
+        _run(["git", "commit", "-m", f"c{i}"], cwd=repo, env=env)
+
+
+def test_order_repos_largest_first_dispatches_biggest_history_first(tmp_path: Path) -> None:
+    root = tmp_path / "scan"
+    _init_repo(repo=root / "a_small", remote="git@github.com:org/small.git", commits=1)
+    _init_repo(repo=root / "b_big", remote="git@github.com:org/big.git", commits=4)
+    _init_repo(repo=root / "c_mid", remote="git@github.com:org/mid.git", commits=2)
+
+    _candidates, repos_to_analyze, _rows = discover_and_select_repos(
+        root,
+        exclude_dirnames={".git"},
+        include_remote_prefixes=[],
+        remote_name_priority=["origin"],
+        remote_filter_mode="any",
+        exclude_forks=False,
+        fork_remote_names=["upstream"],
+        excluded_repos=[],
+        dedupe="path",
+    )
+
+    assert [Path(p).name for _, p, *_rest in repos_to_analyze] == ["a_small", "b_big", "c_mid"]
+
+    ordered = order_repos_largest_first(repos_to_analyze, jobs=2)
+    assert [Path(p).name for _, p, *_rest in ordered] == ["b_big", "c_mid", "a_small"]
+
+
+def test_order_repos_largest_first_keeps_order_without_git_for_one_job(monkeypatch) -> None:
+    import git_analysis.analysis_selection as selection
+
+    def no_commit_count(repo: Path) -> int | None:
+        raise AssertionError(f"commit count read for {repo}")
+
+    monkeypatch.setattr(selection, "get_commit_count", no_commit_count)
+    repos = [(f"k{i}", Path(f"/r/{i}"), "origin", "", "", []) for i in range(3)]
+
+    assert order_repos_largest_first(repos, jobs=1) == repos
+
+
+def test_discover_and_select_repos_reads_last_commit_once_per_clone(tmp_path: Path, monkeypatch) -> None:
+    import git_analysis.analysis_selection as selection
+
+    root = tmp_path / "scan"
+    # The first clone has no commits, so every later duplicate has to compare against an unknown timestamp.
+    _init_repo(repo=root / "a_empty", remote="git@github.com:org/same.git", commits=0)
+    _init_repo(repo=root / "b_clone", remote="git@github.com:org/same.git", commits=1)
+    _init_repo(repo=root / "c_clone", remote="git@github.com:org/same.git", commits=1)
+
+    calls: list[Path] = []
+    real_get_last_commit = selection.get_last_commit
+
+    def counting_get_last_commit(repo: Path) -> tuple[str | None, int | None]:
+        calls.append(repo)
+        return real_get_last_commit(repo)
+
+    monkeypatch.setattr(selection, "get_last_commit", counting_get_last_commit)
+
+    _candidates, repos_to_analyze, _rows = discover_and_select_repos(
+        root,
+        exclude_dirnames={".git"},
+        include_remote_prefixes=[],
+        remote_name_priority=["origin"],
+        remote_filter_mode="any",
+        exclude_forks=False,
+        fork_remote_names=["upstream"],
+        excluded_repos=[],
+        dedupe="remote",
+    )
+
+    assert sorted(p.name for p in calls) == ["a_empty", "b_clone", "c_clone"]
+    assert [Path(p).name for _, p, *_rest in repos_to_analyze] == ["b_clone"]
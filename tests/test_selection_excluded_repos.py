@@ -5,6 +5,7 @@ import subprocess
 from pathlib import Path
 
 from git_analysis.analysis_selection import discover_and_select_repos
+from git_analysis.git import discover_git_roots
 
 
 def _run(cmd: list[str], *, cwd: Path, env: dict[str, str] | None = None) -> str:
@@ -53,3 +54,18 @@ def test_discover_and_select_repos_respects_excluded_repos(tmp_path: Path) -> No
     skipped = [r for r in selection_rows if r.get("status") == "skipped" and r.get("reason") == "excluded_repo"]
     assert len(skipped) == 1
 
+
+def test_discover_git_roots_walks_in_order_without_following_symlinks(tmp_path: Path) -> None:
+    root = tmp_path / "scan"
+    for d in ("a/.git", "a/nested/.git", "b/node_modules/dep/.git", "c/deeper/.git"):
+        (root / d).mkdir(parents=True)
+    # Worktrees and submodules mark their root with a `.git` file rather than a directory.
+    (root / "d").mkdir()
+    (root / "d" / ".git").write_text("gitdir: ../elsewhere\n", encoding="utf-8")
+    (root / "link").symlink_to(root / "a", target_is_directory=True)
+
+    roots = discover_git_roots(root, {"node_modules"})
+
+    assert sorted(roots) == [root / "a", root / "a" / "nested", root / "c" / "deeper", root / "d"]
+    # Parents come before the repos nested inside them (pre-order, like os.walk).
+    assert roots.index(root / "a") < roots.index(root / "a" / "nested")